@@ -0,0 +1,111 @@
+"""Persistent cache of parsed action.yml documents."""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+class ParsedActionCache:
+    """SQLite-backed cache of parsed action.yml content keyed by its SHA-256.
+
+    Entries are content-addressed, so they never go stale and never expire.
+    Only documents made of plain JSON types are stored; anything else (YAML
+    timestamps, binary values, non-string keys) is simply re-parsed. The
+    connection is shared and guarded by an in-process lock, as in
+    CommitMetadataCache.
+
+    ``set`` is called while an audit is resolving actions, so it only queues
+    the row for a single writer thread (as AnalysisStorage does); until the
+    write lands, ``get`` serves the document from memory.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Open (and create if needed) the cache database.
+
+        Without db_path the database lives in ACTSENSE_DATA_DIR, or in the
+        repository's data/ directory when that is not set.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            data_dir = os.getenv("ACTSENSE_DATA_DIR")
+            data_path = Path(data_dir) if data_dir else Path(__file__).parent.parent / "data"
+            self.db_path = data_path / "action_cache.sqlite3"
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # WAL commits then skip the fsync; a cached parse lost to a power
+            # cut is simply parsed again.
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS parsed_actions (
+                    digest TEXT PRIMARY KEY,
+                    parsed BLOB NOT NULL,
+                    parsed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        # digest -> serialized document queued on the writer but not yet stored
+        self._pending: Dict[str, bytes] = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="action-cache-writer")
+
+    @staticmethod
+    def _digest(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, content: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed document for content, or None on a miss."""
+        digest = self._digest(content)
+        with self._lock:
+            blob = self._pending.get(digest)
+            if blob is None:
+                row = self._conn.execute(
+                    "SELECT parsed FROM parsed_actions WHERE digest = ?",
+                    (digest,),
+                ).fetchone()
+                blob = row[0] if row else None
+        return orjson.loads(blob) if blob is not None else None
+
+    def set(self, content: str, parsed: Dict[str, Any]) -> None:
+        """Store the parsed document for content if it is plain JSON."""
+        try:
+            blob = orjson.dumps(parsed, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return
+        digest = self._digest(content)
+        with self._lock:
+            self._pending[digest] = blob
+        self._writer.submit(self._write_pending, digest, blob)
+
+    def _write_pending(self, digest: str, blob: bytes) -> None:
+        """Store a queued document on the writer thread, then drop it from memory."""
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO parsed_actions (digest, parsed, parsed_at) VALUES (?, ?, ?)",
+                    (digest, blob, time.time()),
+                )
+                self._conn.commit()
+            finally:
+                self._pending.pop(digest, None)
+
+    def flush(self) -> None:
+        """Block until every queued write has been stored."""
+        self._writer.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Store queued writes and close the database connection."""
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
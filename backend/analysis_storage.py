@@ -1,32 +1,169 @@
 """Storage for analysis results."""
-import json
 import logging
+import mmap
 import os
 import datetime
+import itertools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import uuid
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Append-only log of analysis summaries (and deletion tombstones) so listing
+# never has to open the full analysis files.
+INDEX_FILENAME = "_index.jsonl"
+
+# Graph payloads live in this subdirectory, apart from the small metadata
+# documents, so nothing but get_analysis ever has to read them.
+GRAPHS_DIRNAME = "graphs"
+
+# Analysis files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1024 * 1024
+
 
 class AnalysisStorage:
     """Store and retrieve analysis results.
 
     All write operations (save, delete) are protected by an in-process lock so
     concurrent audit requests cannot corrupt each other's JSON files.
+
+    Listing is served from an in-memory index of metadata summaries that is
+    persisted as ``_index.jsonl``: one line is appended per save and a
+    tombstone per delete. The log is compacted when storage is opened and
+    rebuilt from the analysis files if it is missing.
+
+    Each analysis is stored as two documents: ``{id}.json`` holds the
+    metadata and ``graphs/{id}.json`` holds the graph. Files written before
+    the split keep the graph inline and are still read transparently.
+
+    ``save_analysis_in_background`` hands the write to a single writer
+    thread; until it lands, ``get_analysis`` and ``list_analyses`` serve the
+    analysis from memory.
     """
 
     def __init__(self, storage_dir: Optional[str] = None):
-        """Initialize storage directory."""
+        """Initialize storage directory.
+
+        Without storage_dir, analyses live under ACTSENSE_DATA_DIR, or under
+        the repository's data/ directory when that is not set.
+        """
         if storage_dir:
             self.storage_dir = Path(storage_dir)
         else:
-            self.storage_dir = Path(__file__).parent.parent / "data" / "analyses"
+            data_dir = os.getenv("ACTSENSE_DATA_DIR")
+            data_path = Path(data_dir) if data_dir else Path(__file__).parent.parent / "data"
+            self.storage_dir = data_path / "analyses"
 
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._graphs_dir = self.storage_dir / GRAPHS_DIRNAME
+        self._graphs_dir.mkdir(exist_ok=True)
+        # Stored documents are compact unless pretty output is asked for
+        # (ACTSENSE_PRETTY_JSON=1), which makes them easier to inspect by hand.
+        self._json_options = orjson.OPT_INDENT_2 if os.environ.get("ACTSENSE_PRETTY_JSON") == "1" else 0
         self._lock = threading.Lock()
+        self._index_path = self.storage_dir / INDEX_FILENAME
+        # analysis id -> metadata summary, oldest first
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._load_index()
+        # analysis id -> full analysis queued on the writer but not yet on disk
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # One thread, so background saves land in the order they were made
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis-writer")
+
+    @staticmethod
+    def _summarize(analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the metadata returned by list_analyses (no graph data)."""
+        return {
+            "id": analysis["id"],
+            "timestamp": analysis["timestamp"],
+            "repository": analysis.get("repository"),
+            "action": analysis.get("action"),
+            "method": analysis.get("method", "api"),
+            "statistics": analysis.get("statistics", {})
+        }
+
+    @staticmethod
+    def _write_atomic(file_path: Path, data: bytes):
+        """Write data to a temp file, then atomically rename it into place.
+
+        A partial write therefore never leaves a corrupted JSON file on disk.
+        """
+        tmp_path = file_path.with_suffix(".json.tmp")
+        try:
+            # One write and one rename per file; no fsync, since an analysis
+            # lost to a power cut can simply be re-run.
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _read_json(file_path: Path) -> Optional[Any]:
+        """Parse a JSON file, returning None if it does not exist."""
+        try:
+            f = open(file_path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        with f:
+            if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+
+            # Let the page cache back the parser's input instead of copying
+            # a large graph document into a bytes object first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    def _load_index(self):
+        """Load and compact the index, rebuilding it from analysis files if missing."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        if self._index_path.exists():
+            with open(self._index_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A crash mid-append can leave a truncated last line
+                        logger.warning("Skipping malformed line in %s", self._index_path)
+                        continue
+                    if record.get("deleted"):
+                        entries.pop(record["id"], None)
+                    else:
+                        entries[record["id"]] = record
+        else:
+            with os.scandir(self.storage_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    try:
+                        with open(entry.path, 'rb') as f:
+                            summary = self._summarize(orjson.loads(f.read()))
+                        entries[summary["id"]] = summary
+                    except Exception:
+                        logger.exception("Error reading analysis file %s", entry.path)
+
+        self._index = dict(sorted(entries.items(), key=lambda item: item[1]["timestamp"]))
+
+        # Rewrite the log without superseded lines and tombstones
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            for summary in self._index.values():
+                f.write(orjson.dumps(summary, option=orjson.OPT_APPEND_NEWLINE))
+        tmp_path.replace(self._index_path)
+
+    def _append_index(self, record: Dict[str, Any]):
+        """Append one record to the on-disk index. Caller must hold the lock."""
+        with open(self._index_path, 'ab') as f:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
 
     def save_analysis(
         self,
@@ -37,41 +174,92 @@ class AnalysisStorage:
         method: str = "api"
     ) -> str:
         """Save an analysis and return its ID."""
-        analysis_id = str(uuid.uuid4())
+        summary = self._new_summary(repository, action, statistics, method)
+        self._write_analysis(summary, graph_data)
+        return summary["id"]
 
-        analysis = {
-            "id": analysis_id,
+    def save_analysis_in_background(
+        self,
+        repository: Optional[str],
+        action: Optional[str],
+        graph_data: Dict[str, Any],
+        statistics: Dict[str, Any],
+        method: str = "api"
+    ) -> str:
+        """Queue an analysis for saving and return its ID without waiting for the write."""
+        summary = self._new_summary(repository, action, statistics, method)
+        analysis_id = summary["id"]
+        with self._lock:
+            self._pending[analysis_id] = {**summary, "graph": graph_data}
+        self._writer.submit(self._write_pending, summary, graph_data)
+        return analysis_id
+
+    def flush(self):
+        """Block until every queued background save has been written."""
+        self._writer.submit(lambda: None).result()
+
+    @staticmethod
+    def _new_summary(
+        repository: Optional[str],
+        action: Optional[str],
+        statistics: Dict[str, Any],
+        method: str
+    ) -> Dict[str, Any]:
+        """Return the metadata document for a new analysis."""
+        return {
+            "id": str(uuid.uuid4()),
             "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
             "repository": repository,
             "action": action,
             "method": method,
-            "graph": graph_data,
             "statistics": statistics
         }
 
-        file_path = self.storage_dir / f"{analysis_id}.json"
+    def _write_pending(self, summary: Dict[str, Any], graph_data: Dict[str, Any]):
+        """Write a queued analysis on the writer thread, then drop it from memory."""
+        try:
+            self._write_analysis(summary, graph_data)
+        except Exception:
+            logger.exception("Error saving analysis %s", summary["id"])
+        finally:
+            with self._lock:
+                self._pending.pop(summary["id"], None)
+
+    def _write_analysis(self, summary: Dict[str, Any], graph_data: Dict[str, Any]):
+        """Write an analysis' graph and metadata documents and index it."""
+        analysis_id = summary["id"]
+        graph_document = {"id": analysis_id, "graph": graph_data}
+
         with self._lock:
-            # Write to a temp file first, then atomically rename so a partial
-            # write never leaves a corrupted JSON file on disk.
-            tmp_path = file_path.with_suffix(".tmp")
-            try:
-                with open(tmp_path, 'w') as f:
-                    json.dump(analysis, f, indent=2)
-                tmp_path.replace(file_path)
-            except Exception:
-                tmp_path.unlink(missing_ok=True)
-                raise
+            # Graph first, so a metadata file never points at a missing graph
+            self._write_atomic(
+                self._graphs_dir / f"{analysis_id}.json",
+                orjson.dumps(graph_document, option=self._json_options)
+            )
+            self._write_atomic(
+                self.storage_dir / f"{analysis_id}.json",
+                orjson.dumps(summary, option=self._json_options)
+            )
 
-        return analysis_id
+            self._index[analysis_id] = summary
+            self._append_index(summary)
 
     def get_analysis(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve an analysis by ID."""
-        file_path = self.storage_dir / f"{analysis_id}.json"
-        if not file_path.exists():
+        pending = self._pending.get(analysis_id)
+        if pending is not None:
+            return dict(pending)
+
+        analysis = self._read_json(self.storage_dir / f"{analysis_id}.json")
+        if analysis is None:
             return None
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        # Analyses saved before the graph split carry the graph inline
+        if "graph" not in analysis:
+            graph_document = self._read_json(self._graphs_dir / f"{analysis_id}.json")
+            analysis["graph"] = graph_document["graph"] if graph_document else {}
+
+        return analysis
 
     def list_analyses(
         self,
@@ -81,43 +269,40 @@ class AnalysisStorage:
         """List all analyses, optionally filtered by repository."""
         analyses = []
 
-        for file_path in sorted(
-            self.storage_dir.glob("*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        ):
-            try:
-                with open(file_path, 'r') as f:
-                    analysis = json.load(f)
-
+        with self._lock:
+            # Background saves not yet indexed are newer than anything indexed
+            # and queued oldest-first; an analysis being written can briefly be
+            # in both, so skip those index entries.
+            pending = [self._summarize(analysis) for analysis in reversed(self._pending.values())]
+            # The index is oldest-first, so walk it backwards for newest-first
+            indexed = (
+                summary for summary in reversed(self._index.values())
+                if summary["id"] not in self._pending
+            )
+            for summary in itertools.chain(pending, indexed):
                 # Filter by repository if specified
-                if repository and analysis.get("repository") != repository:
+                if repository and summary.get("repository") != repository:
                     continue
 
-                # Return only metadata, not full graph data
-                analyses.append({
-                    "id": analysis["id"],
-                    "timestamp": analysis["timestamp"],
-                    "repository": analysis.get("repository"),
-                    "action": analysis.get("action"),
-                    "method": analysis.get("method", "api"),
-                    "statistics": analysis.get("statistics", {})
-                })
+                analyses.append(dict(summary))
 
                 if len(analyses) >= limit:
                     break
-            except Exception:
-                logger.exception("Error reading analysis file %s", file_path)
-                continue
 
         return analyses
 
     def delete_analysis(self, analysis_id: str) -> bool:
         """Delete an analysis by ID."""
+        if analysis_id in self._pending:
+            self.flush()
         file_path = self.storage_dir / f"{analysis_id}.json"
         with self._lock:
-            if file_path.exists():
+            try:
                 file_path.unlink()
-                return True
-        return False
+            except FileNotFoundError:
+                return False
+            (self._graphs_dir / f"{analysis_id}.json").unlink(missing_ok=True)
+            if self._index.pop(analysis_id, None) is not None:
+                self._append_index({"id": analysis_id, "deleted": True})
+        return True
 
@@ -0,0 +1,81 @@
+"""Persistent cache for immutable commit metadata."""
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# Only full commit SHAs are immutable; tags and branches can move.
+_FULL_SHA_RE = re.compile(r"^[0-9a-fA-F]{40}$")
+
+
+class CommitMetadataCache:
+    """SQLite-backed cache of commit dates keyed by (owner, repo, sha).
+
+    A commit's date never changes, so entries never expire. The connection is
+    shared and guarded by an in-process lock so concurrent audits can use the
+    same cache instance.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Open (and create if needed) the cache database.
+
+        Without db_path the database lives in ACTSENSE_DATA_DIR, or in the
+        repository's data/ directory when that is not set.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            data_dir = os.getenv("ACTSENSE_DATA_DIR")
+            data_path = Path(data_dir) if data_dir else Path(__file__).parent.parent / "data"
+            self.db_path = data_path / "commit_cache.sqlite3"
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS commit_dates (
+                    owner TEXT NOT NULL,
+                    repo TEXT NOT NULL,
+                    sha TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (owner, repo, sha)
+                )
+                """
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def is_immutable_ref(ref: Optional[str]) -> bool:
+        """Return True if ref is a full 40-character commit SHA."""
+        return bool(ref) and _FULL_SHA_RE.match(ref) is not None
+
+    def get_commit_date(self, owner: str, repo: str, sha: str) -> Optional[str]:
+        """Return the cached commit date, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT date FROM commit_dates WHERE owner = ? AND repo = ? AND sha = ?",
+                (owner, repo, sha.lower()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_commit_date(self, owner: str, repo: str, sha: str, date: str) -> None:
+        """Store the commit date for a full commit SHA."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO commit_dates (owner, repo, sha, date, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (owner, repo, sha.lower(), date, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
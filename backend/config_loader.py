@@ -1,9 +1,16 @@
 """Configuration loader for trusted action publishers."""
 import os
 import yaml
-from typing import List
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python when
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 class ConfigLoader:
     """Load and manage application configuration."""
@@ -26,6 +33,10 @@ class ConfigLoader:
             else:
                 # Default to config.yaml in backend directory
                 self.config_path = Path(__file__).parent / "config.yaml"
+
+        # Parsed publishers keyed by (path, st_mtime_ns, st_size) of the file
+        # they were read from, so repeated loads skip the read + YAML parse.
+        self._cache: Optional[Tuple[Tuple[str, int, int], List[str]]] = None
     
     def load_trusted_publishers(self) -> List[str]:
         """Load trusted publishers from config file.
@@ -37,38 +48,23 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid YAML
         """
-        if not self.config_path.exists():
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
             # Return default trusted publishers if config file doesn't exist
             return self._get_default_trusted_publishers()
+
+        cache_key = (str(self.config_path), st.st_mtime_ns, st.st_size)
+        if self._cache is not None and self._cache[0] == cache_key:
+            return list(self._cache[1])
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            if not config:
-                return self._get_default_trusted_publishers()
+            with open(self.config_path, 'rb') as f:
+                config = yaml.load(f.read(), Loader=_Loader)
             
-            trusted_publishers = config.get("trusted_publishers", [])
-            
-            # Validate that it's a list
-            if not isinstance(trusted_publishers, list):
-                return self._get_default_trusted_publishers()
-            
-            # Filter out empty strings and validate format
-            valid_publishers = []
-            for publisher in trusted_publishers:
-                if isinstance(publisher, str) and publisher.strip():
-                    # Ensure it ends with / for prefix matching
-                    publisher = publisher.strip()
-                    if not publisher.endswith("/"):
-                        publisher = publisher + "/"
-                    valid_publishers.append(publisher)
-            
-            # If no valid publishers found, return defaults
-            if not valid_publishers:
-                return self._get_default_trusted_publishers()
-            
-            return valid_publishers
+            valid_publishers = self._extract_publishers(config)
+            self._cache = (cache_key, valid_publishers)
+            return list(valid_publishers)
             
         except (yaml.YAMLError, Exception) as e:
             # If there's an error loading config, return defaults
@@ -76,6 +72,33 @@ class ConfigLoader:
             print("Using default trusted publishers.")
             return self._get_default_trusted_publishers()
     
+    def _extract_publishers(self, config) -> List[str]:
+        """Validate the parsed config and return normalized publisher prefixes."""
+        if not config:
+            return self._get_default_trusted_publishers()
+        
+        trusted_publishers = config.get("trusted_publishers", [])
+        
+        # Validate that it's a list
+        if not isinstance(trusted_publishers, list):
+            return self._get_default_trusted_publishers()
+        
+        # Filter out empty strings and validate format
+        valid_publishers = []
+        for publisher in trusted_publishers:
+            if isinstance(publisher, str) and publisher.strip():
+                # Ensure it ends with / for prefix matching
+                publisher = publisher.strip()
+                if not publisher.endswith("/"):
+                    publisher = publisher + "/"
+                valid_publishers.append(publisher)
+        
+        # If no valid publishers found, return defaults
+        if not valid_publishers:
+            return self._get_default_trusted_publishers()
+        
+        return valid_publishers
+    
     def _get_default_trusted_publishers(self) -> List[str]:
         """Get default trusted publishers if config file is missing or invalid."""
         return [
@@ -107,8 +130,8 @@ class ConfigLoader:
         # Load existing config
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
+                with open(self.config_path, 'rb') as f:
+                    config = yaml.load(f.read(), Loader=_Loader) or {}
             except Exception:
                 config = {}
         else:
@@ -128,9 +151,10 @@ class ConfigLoader:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write back to file
+            self._cache = None
             try:
                 with open(self.config_path, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
                 return True
             except Exception as e:
                 print(f"Error writing config: {e}")
@@ -146,8 +170,9 @@ _config_loader = None
 def get_trusted_publishers() -> List[str]:
     """Get trusted publishers from config.
     
-    This function caches the config loader and results for performance.
-    To reload config, set _config_loader to None.
+    The shared loader caches the parsed list and only re-reads the file
+    when its mtime or size changes. To reload config, set _config_loader
+    to None.
     
     Returns:
         List of trusted publisher prefixes
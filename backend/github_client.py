@@ -1,38 +1,244 @@
 """GitHub API client for fetching repositories and actions."""
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import re
+import time
 import httpx
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, NamedTuple, Tuple
 import base64
+import orjson
 from fastapi import HTTPException
+from packaging.version import InvalidVersion, Version
+from commit_cache import CommitMetadataCache
+
+# Maximum number of GitHub requests a single client has on the wire at once,
+# so concurrent dependency resolution stays clear of secondary rate limits.
+MAX_CONCURRENT_REQUESTS = 10
+# Maximum number of URLs whose last response is kept, and how long (seconds)
+# one is served without asking GitHub again. Older entries that carry an ETag
+# are revalidated with If-None-Match instead of being fetched in full.
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_TTL = 300.0
+# Secondary rate limits (403/429 with Retry-After, or a bare 429) are retried
+# up to MAX_RETRIES times, backing off exponentially from RETRY_BASE_DELAY
+# when GitHub gives no Retry-After. Waits longer than MAX_RETRY_DELAY are not
+# worth holding an audit for, so those responses are returned as they are.
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+# The cached body is stored decoded, so these must not be replayed with it.
+_UNREPLAYABLE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# HTTP/2 lets one TLS connection per host carry every concurrent request;
+# httpx only negotiates it when the h2 package (httpx[http2]) is installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# File suffixes GitHub Actions loads workflows from
+WORKFLOW_SUFFIXES = (".yml", ".yaml")
+
+# Repositories looked up per GraphQL query when prefetching action metadata
+GRAPHQL_BATCH_SIZE = 50
+
+# owner/repo[/subdir][@ref] with at most one "@"; anything else takes the
+# slower split-based path in parse_action_reference.
+_ACTION_REF_RE = re.compile(r'^([^/@]+)/([^/@]+)(?:/([^@]+))?(?:@([^@]*))?$')
+
+
+# Response cache shared between GitHubClients: (auth scope, url) -> entry
+ResponseCache = "OrderedDict[Tuple[str, str], _CachedResponse]"
+# GETs in flight, shareable between GitHubClients: (auth scope, url) -> task
+InflightRequests = "Dict[Tuple[str, str], asyncio.Task[httpx.Response]]"
+
+
+class _CachedResponse(NamedTuple):
+    etag: Optional[str]
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    fetched_at: float
 
 
 class GitHubClient:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        commit_cache: Optional[CommitMetadataCache] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        response_cache: Optional[ResponseCache] = None,
+        inflight: Optional[InflightRequests] = None,
+    ):
         self.token = token
+        self.commit_cache = commit_cache
         self.base_url = "https://api.github.com"
+        self.raw_base_url = "https://raw.githubusercontent.com"
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
         }
         if token:
             self.headers["Authorization"] = f"token {token}"
+        # Every API call reuses keep-alive connections from one pool instead of
+        # re-doing DNS, TCP and TLS setup per request. A caller-provided pool
+        # (shared across audits) is used as-is and left open by aclose(); the
+        # auth headers are then sent per request since the pool has none.
+        self._owns_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                headers=self.headers,
+                http2=HTTP2_AVAILABLE,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+        self._client = http_client
+        # (auth scope, url) -> last 200/404 response, served as-is while fresh
+        # and replayed when GitHub answers If-None-Match with 304 (which is not
+        # rate-limited). A caller-provided cache is shared with other clients,
+        # so entries are scoped by a hash of the token: a response fetched
+        # with one token is never served to a client holding another.
+        self._response_cache: ResponseCache = OrderedDict() if response_cache is None else response_cache
+        self._cache_scope = hashlib.sha256(token.encode()).hexdigest() if token else ""
+        # (auth scope, url) -> task for a GET that is currently in flight, so
+        # concurrent callers asking for the same URL share one request. A
+        # caller-provided map is shared with other clients, so concurrent
+        # audits with the same token also share requests.
+        self._inflight: InflightRequests = {} if inflight is None else inflight
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # (owner, repo, subdir path) -> get_action_metadata result found by
+        # prefetch_action_metadata
+        self._prefetched_metadata: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        # (owner, repo, path) -> content of other files prefetched alongside
+        # action.yml, served by get_file_content
+        self._prefetched_files: Dict[Tuple[str, str, str], str] = {}
+        # (owner, repo) -> task decoding that repository's info, shared by the
+        # resolver and the rules that check the same repository for the rest
+        # of the audit. Failed lookups are retried by the next caller.
+        # prefetch_action_metadata seeds it for the repositories it finds.
+        self._repo_info: Dict[Tuple[str, str], "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool if this client created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _get(self, url: str) -> httpx.Response:
+        """GET a URL, joining an identical request that is already in flight.
+
+        The shared request runs in its own task and is awaited through
+        ``asyncio.shield`` so one caller being cancelled does not abort it for
+        the others.
+        """
+        key = (self._cache_scope, url)
+        inflight = self._inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url))
+            inflight[key] = task
+
+            def _done(t: "asyncio.Task[httpx.Response]") -> None:
+                if inflight.get(key) is t:
+                    del inflight[key]
+                # Mark the exception retrieved in case every waiter went away.
+                if not t.cancelled():
+                    t.exception()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _fetch(self, url: str) -> httpx.Response:
+        """GET a URL through the response cache, revalidating stale entries by ETag."""
+        key = (self._cache_scope, url)
+        cached = self._response_cache.get(key)
+        if cached is not None and time.monotonic() - cached.fetched_at < RESPONSE_TTL:
+            self._response_cache.move_to_end(key)
+            return self._replay(cached, httpx.Request("GET", url))
+        
+        headers = {} if self._owns_client else dict(self.headers)
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        attempt = 0
+        while True:
+            async with self._request_slots:
+                response = await self._client.get(url, headers=headers)
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            # Sleep without holding a request slot
+            attempt += 1
+            await asyncio.sleep(delay)
+        
+        if cached is not None and cached.etag and response.status_code == 304:
+            self._store(key, cached._replace(fetched_at=time.monotonic()))
+            return self._replay(cached, response.request)
+        
+        if response.status_code in (200, 404):
+            headers = {
+                k: v for k, v in response.headers.items()
+                if k.lower() not in _UNREPLAYABLE_HEADERS
+            }
+            self._store(key, _CachedResponse(
+                response.headers.get("ETag"),
+                response.status_code,
+                headers,
+                response.content,
+                time.monotonic(),
+            ))
+        return response
+
+    def _store(self, key: Tuple[str, str], entry: _CachedResponse) -> None:
+        """Insert or refresh a cache entry, evicting the least recently used."""
+        self._response_cache[key] = entry
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    @staticmethod
+    def _replay(entry: _CachedResponse, request: httpx.Request) -> httpx.Response:
+        """Build a fresh response object from a cache entry."""
+        return httpx.Response(entry.status_code, headers=entry.headers, content=entry.content, request=request)
 
     async def get_repo_contents(self, owner: str, repo: str, path: str = "") -> Dict[str, Any]:
         """Get repository contents at a specific path."""
         url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, timeout=10.0)
-            if response.status_code == 403:
-                # Check if it's a rate limit error
-                rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", "0")
-                if rate_limit_remaining == "0":
-                    raise HTTPException(
-                        status_code=403,
-                        detail="GitHub API rate limit exceeded. Please provide a GitHub token to increase your rate limit from 60/hour to 5000/hour."
-                    )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(url)
+        if response.status_code == 403:
+            # Check if it's a rate limit error
+            rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", "0")
+            if rate_limit_remaining == "0":
+                raise HTTPException(
+                    status_code=403,
+                    detail="GitHub API rate limit exceeded. Please provide a GitHub token to increase your rate limit from 60/hour to 5000/hour."
+                )
+        response.raise_for_status()
+        # Decode straight from the body bytes; directory listings can be large
+        return orjson.loads(response.content)
+
+    async def get_file_content_raw(self, owner: str, repo: str, path: str, ref: str = "HEAD") -> Optional[str]:
+        """Get file content from raw.githubusercontent.com, or None if it is not served there.
+
+        The raw host returns the bare file (no JSON envelope, no base64) and
+        does not count against the REST API rate limit.
+        """
+        try:
+            response = await self._get(f"{self.raw_base_url}/{owner}/{repo}/{ref}/{path}")
+        except httpx.HTTPError:
+            return None
+        if response.status_code != 200:
+            return None
+        return response.text
 
     async def get_file_content(self, owner: str, repo: str, path: str) -> str:
         """Get file content from repository."""
+        content = self._prefetched_files.get((owner, repo, path))
+        if content is not None:
+            return content
+        content = await self.get_file_content_raw(owner, repo, path)
+        if content is not None:
+            return content
+        
+        # Directories, missing files and raw-host failures go through the
+        # contents API, which reports them the way callers expect.
         try:
             contents = await self.get_repo_contents(owner, repo, path)
         except HTTPException:
@@ -54,7 +260,12 @@ class GitHubClient:
             workflows = await self.get_repo_contents(owner, repo, ".github/workflows")
             if isinstance(workflows, dict):
                 return []
-            return [w for w in workflows if w["name"].endswith((".yml", ".yaml"))]
+            # Skip subdirectories and symlinks up front; Actions only runs
+            # YAML files that sit directly in .github/workflows
+            return [
+                w for w in workflows
+                if w.get("type", "file") == "file" and w["name"].endswith(WORKFLOW_SUFFIXES)
+            ]
         except HTTPException:
             raise
         except httpx.HTTPStatusError as e:
@@ -69,6 +280,102 @@ class GitHubClient:
                     )
             raise HTTPException(status_code=e.response.status_code, detail=f"GitHub API error: {str(e)}")
 
+    async def graphql(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a GraphQL query and return its ``data``, or None on failure.
+
+        GitHub only serves GraphQL to authenticated clients, so this returns
+        None without a request when no token is set.
+        """
+        if not self.token:
+            return None
+        headers = {} if self._owns_client else dict(self.headers)
+        try:
+            async with self._request_slots:
+                response = await self._client.post(
+                    f"{self.base_url}/graphql",
+                    json={"query": query, "variables": variables},
+                    headers=headers,
+                )
+            if response.status_code != 200:
+                return None
+            return orjson.loads(response.content).get("data")
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            return None
+
+    async def prefetch_action_metadata(self, actions: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """Fetch action.yml/action.yaml for many (owner, repo, subdir) at once.
+
+        Each GraphQL query looks up GRAPHQL_BATCH_SIZE repositories, replacing
+        the repository check and two REST probes per action. The Dockerfile
+        next to action.yml comes in the same query, since Docker actions read
+        it right after. Whatever is found is served by get_repository_info,
+        get_action_metadata and get_file_content; anything else still goes
+        through REST. Repository info found this way carries only the fields
+        the auditor reads (name, full_name, private, archived,
+        default_branch). JavaScript entry points are left out: bundled
+        dist/index.js files can be megabytes each.
+        """
+        pending = []
+        for owner, repo, subdir in dict.fromkeys(actions):
+            base_path = subdir.rstrip("/") if subdir else ""
+            if (owner, repo, base_path) not in self._prefetched_metadata:
+                pending.append((owner, repo, base_path))
+        
+        for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+            batch = pending[start:start + GRAPHQL_BATCH_SIZE]
+            declarations = []
+            fields = []
+            variables: Dict[str, Any] = {}
+            for i, (owner, repo, base_path) in enumerate(batch):
+                prefix = f"{base_path}/" if base_path else ""
+                declarations.append(
+                    f"$o{i}: String!, $n{i}: String!, $y{i}: String!, $a{i}: String!, $d{i}: String!"
+                )
+                fields.append(
+                    f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ "
+                    f"name nameWithOwner isPrivate isArchived defaultBranchRef {{ name }} "
+                    f"yml: object(expression: $y{i}) {{ ... on Blob {{ text }} }} "
+                    f"yaml: object(expression: $a{i}) {{ ... on Blob {{ text }} }} "
+                    f"dockerfile: object(expression: $d{i}) {{ ... on Blob {{ text }} }} }}"
+                )
+                variables.update({
+                    f"o{i}": owner,
+                    f"n{i}": repo,
+                    f"y{i}": f"HEAD:{prefix}action.yml",
+                    f"a{i}": f"HEAD:{prefix}action.yaml",
+                    f"d{i}": f"HEAD:{prefix}Dockerfile",
+                })
+            query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+            
+            data = await self.graphql(query, variables)
+            if not data:
+                continue
+            loop = asyncio.get_running_loop()
+            for i, key in enumerate(batch):
+                prefix = f"{key[2]}/" if key[2] else ""
+                repository = data.get(f"r{i}") or {}
+                # A null repository may be an error rather than a 404, so only
+                # found repositories are recorded
+                if repository.get("nameWithOwner") and (key[0], key[1]) not in self._repo_info:
+                    repo_info = loop.create_future()
+                    repo_info.set_result({
+                        "name": repository.get("name"),
+                        "full_name": repository["nameWithOwner"],
+                        "private": bool(repository.get("isPrivate")),
+                        "archived": bool(repository.get("isArchived")),
+                        "default_branch": (repository.get("defaultBranchRef") or {}).get("name"),
+                    })
+                    self._repo_info[(key[0], key[1])] = repo_info
+                # action.yml wins when both exist, as in get_action_metadata
+                for field, filename in (("yml", "action.yml"), ("yaml", "action.yaml")):
+                    text = (repository.get(field) or {}).get("text")
+                    if text is not None:
+                        self._prefetched_metadata[key] = {"content": text, "path": f"{prefix}{filename}"}
+                        break
+                dockerfile = (repository.get("dockerfile") or {}).get("text")
+                if dockerfile is not None:
+                    self._prefetched_files[(key[0], key[1], f"{prefix}Dockerfile")] = dockerfile
+
     async def get_action_metadata(self, owner: str, repo: str, ref: str = "main", subdir: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get action.yml or action.yaml from a repository, optionally from a subdirectory."""
         # Construct the path to action.yml
@@ -79,97 +386,107 @@ class GitHubClient:
             # For root actions, look in the root
             base_path = ""
         
-        for filename in ["action.yml", "action.yaml"]:
-            try:
-                if base_path:
-                    file_path = f"{base_path}/{filename}"
-                else:
-                    file_path = filename
-                content = await self.get_file_content(owner, repo, file_path)
-                return {"content": content, "path": file_path}
-            except HTTPException as e:
-                if e.status_code == 403:
-                    raise
-                continue
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 403:
-                    raise HTTPException(status_code=403, detail=f"GitHub API error: {str(e)}")
-                continue
-            except ValueError:
-                continue
+        prefetched = self._prefetched_metadata.get((owner, repo, base_path))
+        if prefetched is not None:
+            return dict(prefetched)
+        
+        file_paths = [
+            f"{base_path}/{filename}" if base_path else filename
+            for filename in ("action.yml", "action.yaml")
+        ]
+        # Probe both filenames concurrently; action.yml still wins when both exist.
+        tasks = [
+            asyncio.ensure_future(self.get_file_content(owner, repo, file_path))
+            for file_path in file_paths
+        ]
+        try:
+            for file_path, task in zip(file_paths, tasks):
+                try:
+                    content = await task
+                    return {"content": content, "path": file_path}
+                except HTTPException as e:
+                    if e.status_code == 403:
+                        raise
+                    continue
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code == 403:
+                        raise HTTPException(status_code=403, detail=f"GitHub API error: {str(e)}")
+                    continue
+                except ValueError:
+                    continue
+        finally:
+            _cancel_pending(tasks)
         return None
 
     async def get_latest_tag(self, owner: str, repo: str) -> Optional[str]:
         """Get the latest tag/release version from a repository."""
+        # Fire the releases and tags probes together; the releases answer is
+        # preferred (more reliable for versioned releases) and the tags result
+        # is discarded when it is not needed.
+        release_task = asyncio.ensure_future(
+            self._get(f"{self.base_url}/repos/{owner}/{repo}/releases/latest")
+        )
+        tags_task = asyncio.ensure_future(
+            self._get(f"{self.base_url}/repos/{owner}/{repo}/tags?per_page=100")
+        )
         try:
-            # Try releases API first (more reliable for versioned releases)
-            url = f"{self.base_url}/repos/{owner}/{repo}/releases/latest"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
+            try:
+                response = await release_task
                 if response.status_code == 200:
                     release = response.json()
                     tag_name = release.get("tag_name", "")
                     if tag_name:
                         return tag_name
-        except (httpx.HTTPStatusError, Exception):
-            pass
-        
-        try:
-            url = f"{self.base_url}/repos/{owner}/{repo}/tags?per_page=100"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
+            except (httpx.HTTPStatusError, Exception):
+                pass
+            
+            try:
+                response = await tags_task
                 if response.status_code == 200:
                     tags = response.json()
                     if tags and len(tags) > 0:
-                        # Find the highest version number
-                        import re
-                        
-                        def parse_version(version_str: str) -> tuple:
-                            """Parse version string into tuple for comparison (major, minor, patch)."""
-                            # Remove 'v' prefix if present
-                            if version_str.startswith("v"):
-                                version_str = version_str[1:]
-                            
-                            # Match semantic version: major.minor.patch
-                            match = re.match(r'^(\d+)\.?(\d*)?\.?(\d*)?', version_str)
-                            if match:
-                                major = int(match.group(1))
-                                minor = int(match.group(2)) if match.group(2) else 0
-                                patch = int(match.group(3)) if match.group(3) else 0
-                                return (major, minor, patch)
-                            return (0, 0, 0)
-                        
+                        # Find the highest version; Version() accepts a leading
+                        # "v" and orders pre-releases and 4-part versions correctly
                         version_tags = []
                         for tag in tags:
                             tag_name = tag.get("name", "")
-                            # Check if it looks like a version number
-                            if re.match(r'^v?\d+\.?\d*', tag_name):
-                                ver_tuple = parse_version(tag_name)
-                                version_tags.append((ver_tuple, tag_name))
+                            try:
+                                version_tags.append((Version(tag_name), tag_name))
+                            except InvalidVersion:
+                                continue
                         
                         if version_tags:
-                            # Sort by version tuple (highest first)
-                            version_tags.sort(key=lambda x: x[0], reverse=True)
-                            return version_tags[0][1]
+                            return max(version_tags)[1]
                         
                         # If no version tags found, return the first tag
                         return tags[0].get("name", "")
-        except (httpx.HTTPStatusError, Exception):
-            pass
+            except (httpx.HTTPStatusError, Exception):
+                pass
+        finally:
+            _cancel_pending([release_task, tags_task])
         
         return None
 
     async def get_commit_date(self, owner: str, repo: str, sha: str) -> Optional[str]:
         """Get the commit date for a specific SHA."""
+        # Dates of full commit SHAs never change, so they can be served from
+        # the persistent cache; mutable refs like branches are always fetched.
+        cacheable = self.commit_cache is not None and CommitMetadataCache.is_immutable_ref(sha)
+        if cacheable:
+            cached_date = self.commit_cache.get_commit_date(owner, repo, sha)
+            if cached_date:
+                return cached_date
         try:
             url = f"{self.base_url}/repos/{owner}/{repo}/commits/{sha}"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
-                if response.status_code == 200:
-                    commit = response.json()
-                    commit_info = commit.get("commit", {})
-                    author_info = commit_info.get("author", {})
-                    return author_info.get("date")  # ISO 8601 format
+            response = await self._get(url)
+            if response.status_code == 200:
+                commit = response.json()
+                commit_info = commit.get("commit", {})
+                author_info = commit_info.get("author", {})
+                date = author_info.get("date")  # ISO 8601 format
+                if cacheable and date:
+                    self.commit_cache.set_commit_date(owner, repo, sha, date)
+                return date
         except (httpx.HTTPStatusError, Exception):
             pass
         return None
@@ -183,34 +500,32 @@ class GitHubClient:
         # Get the commit SHA for the latest tag
         try:
             url = f"{self.base_url}/repos/{owner}/{repo}/git/refs/tags/{latest_tag}"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
-                if response.status_code == 200:
-                    ref_data = response.json()
-                    object_sha = ref_data.get("object", {}).get("sha")
-                    if object_sha:
-                        tag_url = f"{self.base_url}/repos/{owner}/{repo}/git/tags/{object_sha}"
-                        tag_response = await client.get(tag_url, headers=self.headers, timeout=10.0)
-                        if tag_response.status_code == 200:
-                            tag_data = tag_response.json()
-                            commit_sha = tag_data.get("object", {}).get("sha")
-                        else:
-                            # Direct commit reference
-                            commit_sha = object_sha
+            response = await self._get(url)
+            if response.status_code == 200:
+                ref_data = response.json()
+                object_sha = ref_data.get("object", {}).get("sha")
+                if object_sha:
+                    tag_url = f"{self.base_url}/repos/{owner}/{repo}/git/tags/{object_sha}"
+                    tag_response = await self._get(tag_url)
+                    if tag_response.status_code == 200:
+                        tag_data = tag_response.json()
+                        commit_sha = tag_data.get("object", {}).get("sha")
+                    else:
+                        # Direct commit reference
+                        commit_sha = object_sha
                         
-                        if commit_sha:
-                            return await self.get_commit_date(owner, repo, commit_sha)
+                    if commit_sha:
+                        return await self.get_commit_date(owner, repo, commit_sha)
         except (httpx.HTTPStatusError, Exception):
             # Fallback: try to get commit from releases API
             try:
                 url = f"{self.base_url}/repos/{owner}/{repo}/releases/latest"
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url, headers=self.headers, timeout=10.0)
-                    if response.status_code == 200:
-                        release = response.json()
-                        commit_sha = release.get("target_commitish")
-                        if commit_sha:
-                            return await self.get_commit_date(owner, repo, commit_sha)
+                response = await self._get(url)
+                if response.status_code == 200:
+                    release = response.json()
+                    commit_sha = release.get("target_commitish")
+                    if commit_sha:
+                        return await self.get_commit_date(owner, repo, commit_sha)
             except (httpx.HTTPStatusError, Exception):
                 pass
         return None
@@ -223,48 +538,47 @@ class GitHubClient:
         Raises HTTPException on rate limits so callers can surface it to the user.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/repos/{owner}/{repo}/git/refs/tags/{tag}"
-                response = await client.get(url, headers=self.headers, timeout=10.0)
-
-                if response.status_code == 403:
-                    remaining = response.headers.get("X-RateLimit-Remaining", "0")
-                    if remaining == "0":
-                        raise HTTPException(
-                            status_code=403,
-                            detail="GitHub API rate limit exceeded. Provide a GitHub token to resolve SHA hashes."
-                        )
-                if response.status_code != 200:
-                    return None
-
-                data = response.json()
-
-                ref_obj = None
-                if isinstance(data, list):
-                    exact = f"refs/tags/{tag}"
-                    for item in data:
-                        if item.get("ref") == exact:
-                            ref_obj = item
-                            break
-                    if not ref_obj and data:
-                        ref_obj = data[0]
-                elif isinstance(data, dict):
-                    ref_obj = data
-
-                if not ref_obj:
-                    return None
-
-                obj = ref_obj.get("object", {})
-                object_sha = obj.get("sha")
-                if not object_sha:
-                    return None
-
-                if obj.get("type") == "tag":
-                    tag_url = f"{self.base_url}/repos/{owner}/{repo}/git/tags/{object_sha}"
-                    tag_resp = await client.get(tag_url, headers=self.headers, timeout=10.0)
-                    if tag_resp.status_code == 200:
-                        return tag_resp.json().get("object", {}).get("sha", object_sha)
-                return object_sha
+            url = f"{self.base_url}/repos/{owner}/{repo}/git/refs/tags/{tag}"
+            response = await self._get(url)
+
+            if response.status_code == 403:
+                remaining = response.headers.get("X-RateLimit-Remaining", "0")
+                if remaining == "0":
+                    raise HTTPException(
+                        status_code=403,
+                        detail="GitHub API rate limit exceeded. Provide a GitHub token to resolve SHA hashes."
+                    )
+            if response.status_code != 200:
+                return None
+
+            data = response.json()
+
+            ref_obj = None
+            if isinstance(data, list):
+                exact = f"refs/tags/{tag}"
+                for item in data:
+                    if item.get("ref") == exact:
+                        ref_obj = item
+                        break
+                if not ref_obj and data:
+                    ref_obj = data[0]
+            elif isinstance(data, dict):
+                ref_obj = data
+
+            if not ref_obj:
+                return None
+
+            obj = ref_obj.get("object", {})
+            object_sha = obj.get("sha")
+            if not object_sha:
+                return None
+
+            if obj.get("type") == "tag":
+                tag_url = f"{self.base_url}/repos/{owner}/{repo}/git/tags/{object_sha}"
+                tag_resp = await self._get(tag_url)
+                if tag_resp.status_code == 200:
+                    return tag_resp.json().get("object", {}).get("sha", object_sha)
+            return object_sha
         except HTTPException:
             raise
         except Exception:
@@ -277,60 +591,108 @@ class GitHubClient:
             Dict with repo info if exists and accessible, None if 404 (doesn't exist or private),
             raises HTTPException for other errors (rate limits, network issues, etc.)
         """
+        key = (owner, repo)
+        task = self._repo_info.get(key)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = asyncio.ensure_future(self._fetch_repository_info(owner, repo))
+            self._repo_info[key] = task
+            # Mark the exception retrieved in case every waiter went away.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return await asyncio.shield(task)
+
+    async def _fetch_repository_info(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """Request and decode repository information for get_repository_info."""
         url = f"{self.base_url}/repos/{owner}/{repo}"
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=self.headers, timeout=10.0)
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 404:
-                    return None  # Repository doesn't exist or is private/inaccessible
-                elif response.status_code == 403:
-                    # Check if it's a rate limit error
-                    rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", "0")
-                    if rate_limit_remaining == "0":
-                        raise HTTPException(
-                            status_code=403,
-                            detail="GitHub API rate limit exceeded. Please provide a GitHub token to increase your rate limit from 60/hour to 5000/hour."
-                        )
+        try:
+            response = await self._get(url)
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 404:
+                return None  # Repository doesn't exist or is private/inaccessible
+            elif response.status_code == 403:
+                # Check if it's a rate limit error
+                rate_limit_remaining = response.headers.get("X-RateLimit-Remaining", "0")
+                if rate_limit_remaining == "0":
                     raise HTTPException(
                         status_code=403,
-                        detail="Repository is inaccessible (private or insufficient permissions). Provide a token with appropriate scope."
+                        detail="GitHub API rate limit exceeded. Please provide a GitHub token to increase your rate limit from 60/hour to 5000/hour."
                     )
-                else:
-                    # Other HTTP errors - raise to let caller handle
-                    response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                # Re-raise HTTP errors (except 404 which we handle above)
-                if e.response.status_code == 404:
-                    return None
-                # For other status errors, raise HTTPException
-                raise HTTPException(status_code=e.response.status_code, detail=f"GitHub API error: {str(e)}")
-            except httpx.TimeoutException:
-                # Timeout - don't assume repo doesn't exist
-                raise HTTPException(status_code=504, detail="GitHub API request timed out")
-            except Exception as e:
-                # Other errors - don't assume repo doesn't exist
-                raise HTTPException(status_code=500, detail=f"Error checking repository: {str(e)}")
+                raise HTTPException(
+                    status_code=403,
+                    detail="Repository is inaccessible (private or insufficient permissions). Provide a token with appropriate scope."
+                )
+            else:
+                # Other HTTP errors - raise to let caller handle
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # Re-raise HTTP errors (except 404 which we handle above)
+            if e.response.status_code == 404:
+                return None
+            # For other status errors, raise HTTPException
+            raise HTTPException(status_code=e.response.status_code, detail=f"GitHub API error: {str(e)}")
+        except httpx.TimeoutException:
+            # Timeout - don't assume repo doesn't exist
+            raise HTTPException(status_code=504, detail="GitHub API request timed out")
+        except Exception as e:
+            # Other errors - don't assume repo doesn't exist
+            raise HTTPException(status_code=500, detail=f"Error checking repository: {str(e)}")
         return None
 
     def parse_action_reference(self, action_ref: str) -> tuple:
         """Parse action reference like 'owner/repo@v1', 'owner/repo/path@v1', or 'owner/repo@ref'."""
-        if "@" in action_ref:
-            repo_part, ref = action_ref.rsplit("@", 1)
-        else:
-            repo_part = action_ref
-            ref = "main"
-        
-        if "/" in repo_part:
-            parts = repo_part.split("/", 1)
-            if len(parts) == 2:
-                owner = parts[0]
-                repo_path = parts[1]
-                # Split repo and optional subdirectory path
-                repo_path_parts = repo_path.split("/", 1)
-                repo = repo_path_parts[0]
-                subdir = repo_path_parts[1] if len(repo_path_parts) > 1 else None
-                return owner, repo, ref, subdir
-        return None, None, ref, None
+        return _parse_action_reference(action_ref)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_action_reference(action_ref: str) -> tuple:
+    """Split an action reference into (owner, repo, ref, subdir); see GitHubClient.parse_action_reference."""
+    match = _ACTION_REF_RE.match(action_ref)
+    if match:
+        owner, repo, subdir, ref = match.groups()
+        return owner, repo, "main" if ref is None else ref, subdir
+
+    if "@" in action_ref:
+        repo_part, ref = action_ref.rsplit("@", 1)
+    else:
+        repo_part = action_ref
+        ref = "main"
+
+    if "/" in repo_part:
+        parts = repo_part.split("/", 1)
+        if len(parts) == 2:
+            owner = parts[0]
+            repo_path = parts[1]
+            # Split repo and optional subdirectory path
+            repo_path_parts = repo_path.split("/", 1)
+            repo = repo_path_parts[0]
+            subdir = repo_path_parts[1] if len(repo_path_parts) > 1 else None
+            return owner, repo, ref, subdir
+    return None, None, ref, None
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a secondary-rate-limited response, or None."""
+    if attempt >= MAX_RETRIES or response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        # A bare 403 is a permission error or the primary limit (which resets
+        # hourly), neither of which a retry fixes
+        if response.status_code == 403:
+            return None
+        delay = RETRY_BASE_DELAY * 2 ** attempt
+    else:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            return None
+    return delay if delay <= MAX_RETRY_DELAY else None
+
 
+def _cancel_pending(tasks) -> None:
+    """Cancel unfinished tasks and mark finished ones' exceptions as retrieved."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
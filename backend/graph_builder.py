@@ -1,36 +1,62 @@
 """Build dependency graph for GitHub Actions."""
+import sys
 from typing import Dict, List, Set, Optional, Any
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+# Severity ranks for picking a node's worst issue; unknown severities count as
+# "low", and a node without issues is "none".
+SEVERITY_RANK = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+SEVERITY_NAMES = ("none", "low", "medium", "high", "critical")
 
 
 class GraphBuilder:
     def __init__(self):
         self.nodes: Dict[str, Dict[str, Any]] = {}
         self.edges: List[Dict[str, str]] = []
+        # (source, target) of every edge in self.edges, for O(1) duplicate checks
+        self._edge_keys: Set[tuple] = set()
+        # node id -> number of add_edge calls pointing at it, duplicates
+        # included, so popular actions can be weighted in the UI
+        self.ref_counts: Dict[str, int] = defaultdict(int)
+        # True while self.edges is known to be free of redundant edges, so
+        # repeated get_graph_data calls skip the reduction
+        self._reduced = True
         self.issues: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        # severity -> number of issues, kept by add_issues_to_node
+        self._severity_counts: Counter = Counter()
 
     def add_node(self, node_id: str, label: str, node_type: str = "action", metadata: Optional[Dict] = None):
         """Add a node to the graph."""
         if node_id not in self.nodes:
+            # Node ids recur as edge endpoints and issue keys; interning makes
+            # every occurrence share one string object.
+            node_id = sys.intern(node_id)
             self.nodes[node_id] = {
                 "id": node_id,
                 "label": label,
-                "type": node_type,
+                "type": sys.intern(node_type),
                 "metadata": metadata or {},
-                "issues": []
+                "issues": [],
+                "issue_count": 0,
+                "severity": "none"
             }
 
-    def _is_reachable(self, source: str, target: str, exclude_edge: Optional[tuple] = None) -> bool:
-        """Check if target is reachable from source through existing edges."""
+    def _is_reachable(
+        self,
+        source: str,
+        target: str,
+        exclude_edge: Optional[tuple] = None,
+        children: Optional[Dict[str, List[str]]] = None
+    ) -> bool:
+        """Check if target is reachable from source through existing edges.
+        
+        ``children`` is an adjacency list of self.edges to reuse across calls.
+        """
         if source == target:
             return False
         
-        # Build adjacency list for DFS
-        children = defaultdict(list)
-        for edge in self.edges:
-            if exclude_edge and edge["source"] == exclude_edge[0] and edge["target"] == exclude_edge[1]:
-                continue
-            children[edge["source"]].append(edge["target"])
+        if children is None:
+            children = self._children()
         
         # DFS to check reachability
         visited = set()
@@ -43,20 +69,34 @@ class GraphBuilder:
             if node in visited:
                 continue
             visited.add(node)
-            for child in children.get(node, []):
-                if child not in visited:
-                    stack.append(child)
+            for child in children.get(node, ()):
+                if child in visited or (node, child) == exclude_edge:
+                    continue
+                stack.append(child)
         
         return False
     
+    def _children(self) -> Dict[str, List[str]]:
+        """Build the adjacency list of self.edges."""
+        children: Dict[str, List[str]] = defaultdict(list)
+        for edge in self.edges:
+            children[edge["source"]].append(edge["target"])
+        return children
+    
     def add_edge(self, source: str, target: str, edge_type: str = "uses"):
         """Add an edge to the graph, avoiding redundant transitive edges."""
+        # Endpoints are interned so they share the node id strings
+        source = sys.intern(source)
+        target = sys.intern(target)
+        
+        self.ref_counts[target] += 1
+        
         # Check if edge already exists
         edge_key = (source, target)
-        existing_edge_keys = {(e["source"], e["target"]) for e in self.edges}
-        
-        if edge_key in existing_edge_keys:
+        if edge_key in self._edge_keys:
             return
+        self._edge_keys.add(edge_key)
+        self._reduced = False
         
         # Note: We don't check for redundancy here during edge addition
         # because the graph is built incrementally and we don't know all paths yet.
@@ -65,58 +105,121 @@ class GraphBuilder:
         self.edges.append({
             "source": source,
             "target": target,
-            "type": edge_type
+            "type": sys.intern(edge_type)
         })
 
+    def add_edges(self, source: str, targets: List[str], edge_type: str = "uses"):
+        """Add edges from source to each of targets in one call."""
+        source = sys.intern(source)
+        edge_type = sys.intern(edge_type)
+        ref_counts = self.ref_counts
+        edge_keys = self._edge_keys
+        edges = self.edges
+        for target in targets:
+            target = sys.intern(target)
+            ref_counts[target] += 1
+            edge_key = (source, target)
+            if edge_key in edge_keys:
+                continue
+            edge_keys.add(edge_key)
+            self._reduced = False
+            edges.append({"source": source, "target": target, "type": edge_type})
+
     def add_issues_to_node(self, node_id: str, issues: List[Dict[str, Any]]):
         """Add security issues to a node."""
         if node_id in self.nodes:
-            self.nodes[node_id]["issues"].extend(issues)
+            node = self.nodes[node_id]
+            node["issues"].extend(issues)
             self.issues[node_id].extend(issues)
+            
+            # Keep the summary fields current so get_graph_data has no work to do
+            node["issue_count"] = len(node["issues"])
+            rank = SEVERITY_RANK.get(node["severity"], 0)
+            for issue in issues:
+                issue_rank = SEVERITY_RANK.get(issue.get("severity", "low"), 1)
+                if issue_rank > rank:
+                    rank = issue_rank
+            node["severity"] = SEVERITY_NAMES[rank]
+            self._severity_counts.update(issue.get("severity", "low") for issue in issues)
 
     def _remove_redundant_edges(self):
         """Remove edges that are redundant (target is reachable through other paths)."""
-        if not self.edges:
+        if self._reduced or not self.edges:
             return
         
-        # Find redundant edges
-        redundant_edges = set()
-        for edge in self.edges:
-            source = edge["source"]
-            target = edge["target"]
-            
-            # Check if target is still reachable from source without this edge
-            if self._is_reachable(source, target, exclude_edge=(source, target)):
-                redundant_edges.add((source, target))
+        # One adjacency list serves both the reduction and the fallback
+        children = self._children()
+        redundant_edges = self._find_redundant_edges_dag(children)
+        if redundant_edges is None:
+            # The graph has a cycle (e.g. reusable workflows calling each
+            # other), so fall back to checking every edge with a DFS.
+            redundant_edges = set()
+            for edge in self.edges:
+                source = edge["source"]
+                target = edge["target"]
+                
+                # Check if target is still reachable from source without this edge
+                if self._is_reachable(source, target, exclude_edge=(source, target), children=children):
+                    redundant_edges.add((source, target))
         
         # Remove redundant edges
         self.edges = [
             edge for edge in self.edges
             if (edge["source"], edge["target"]) not in redundant_edges
         ]
+        self._edge_keys -= redundant_edges
+        self._reduced = True
+    
+    def _find_redundant_edges_dag(self, children: Dict[str, List[str]]) -> Optional[Set[tuple]]:
+        """Find redundant edges via a transitive reduction; None if the graph is cyclic.
+        
+        Each node's descendants are kept as an int bitset, filled in reverse
+        topological order. Edge u -> v is redundant exactly when another child
+        of u already reaches v.
+        """
+        in_degree: Dict[str, int] = {}
+        for source, targets in children.items():
+            in_degree.setdefault(source, 0)
+            for target in targets:
+                in_degree[target] = in_degree.get(target, 0) + 1
+        
+        # Kahn's algorithm
+        order = [node for node, degree in in_degree.items() if degree == 0]
+        for node in order:
+            for child in children.get(node, ()):
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    order.append(child)
+        if len(order) < len(in_degree):
+            return None
+        
+        bit = {node: 1 << i for i, node in enumerate(order)}
+        reach: Dict[str, int] = {}
+        for node in reversed(order):
+            descendants = 0
+            for child in children.get(node, ()):
+                descendants |= reach[child] | bit[child]
+            reach[node] = descendants
+        
+        redundant_edges = set()
+        for source, targets in children.items():
+            if len(targets) < 2:
+                continue
+            for target in targets:
+                target_bit = bit[target]
+                if any(reach[other] & target_bit for other in targets if other != target):
+                    redundant_edges.add((source, target))
+        return redundant_edges
     
     def get_graph_data(self) -> Dict[str, Any]:
         """Get graph data in format suitable for visualization."""
         # Remove redundant edges before returning graph data
         self._remove_redundant_edges()
         
-        # Calculate issue counts and severity for nodes
+        # issue_count and severity are maintained by add_issues_to_node;
+        # refcount is filled in here since edges may precede their target node
         for node_id, node in self.nodes.items():
-            issues = node.get("issues", [])
-            node["issue_count"] = len(issues)
-            if issues:
-                severities = [issue.get("severity", "low") for issue in issues]
-                if "critical" in severities:
-                    node["severity"] = "critical"
-                elif "high" in severities:
-                    node["severity"] = "high"
-                elif "medium" in severities:
-                    node["severity"] = "medium"
-                else:
-                    node["severity"] = "low"
-            else:
-                node["severity"] = "none"
-
+            node["refcount"] = self.ref_counts.get(node_id, 0)
         return {
             "nodes": list(self.nodes.values()),
             "edges": self.edges,
@@ -127,18 +230,14 @@ class GraphBuilder:
         """Get statistics about the graph."""
         total_nodes = len(self.nodes)
         total_edges = len(self.edges)
-        total_issues = sum(len(issues) for issues in self.issues.values())
-        
-        severity_counts = defaultdict(int)
-        for issues in self.issues.values():
-            for issue in issues:
-                severity_counts[issue.get("severity", "low")] += 1
+        # Issue totals are counted as issues are added
+        total_issues = sum(self._severity_counts.values())
         
         return {
             "total_nodes": total_nodes,
             "total_edges": total_edges,
             "total_issues": total_issues,
-            "severity_counts": dict(severity_counts),
+            "severity_counts": dict(self._severity_counts),
             "nodes_with_issues": len(self.issues)
         }
 
@@ -2,27 +2,156 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any, Set, Callable
+from typing import Optional, List, Dict, Any, Set, Callable, NamedTuple, Tuple
 import asyncio
-import json
+import concurrent.futures
+import hashlib
+import httpx
+import orjson
 import os
 import re
 import logging
+import mimetypes
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import uvicorn
 import yaml
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
 from urllib.parse import urlparse
-from github_client import GitHubClient
+from github_client import (
+    HTTP2_AVAILABLE,
+    WORKFLOW_SUFFIXES,
+    GitHubClient,
+    InflightRequests,
+    ResponseCache,
+    _cancel_pending,
+)
 from workflow_parser import WorkflowParser
 from security_auditor import SecurityAuditor
 from graph_builder import GraphBuilder
 from repo_cloner import RepoCloner, CloneError
 from analysis_storage import AnalysisStorage
+from commit_cache import CommitMetadataCache
+from action_cache import ParsedActionCache
+
+# Connection pool shared by every GitHubClient while the app is running, so
+# keep-alive connections to api.github.com survive from one audit to the next.
+_http_client: Optional[httpx.AsyncClient] = None
+# GitHub responses shared by every audit in this process, so popular actions
+# (actions/checkout, ...) are fetched once rather than once per audit
+_response_cache: ResponseCache = OrderedDict()
+# GitHub requests in flight across every audit, so concurrent audits that
+# need the same URL (with the same token) wait on one request
+_inflight_requests: InflightRequests = {}
+# Worker processes for auditing large action bundles off the event loop,
+# created in lifespan; audits run inline while it is None.
+_audit_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+# Below this much JS/Dockerfile text, pickling the payload to a worker costs
+# more than scanning it in place.
+AUDIT_OFFLOAD_MIN_SIZE = 50_000
+# audit_action results by a digest of the action ref and everything it was
+# audited from (action.yml text, JS entry point, Dockerfile). Repeat audits of
+# an unchanged action, e.g. actions/checkout@v4 across many repositories,
+# reuse the issues instead of re-running every rule.
+AUDIT_RESULT_CACHE_SIZE = 1024
+_audit_results: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+# Clones hold a thread for up to several git timeouts; they get their own
+# threads so a burst of clone audits cannot exhaust the default executor that
+# asyncio.to_thread (analysis reads, workflow file reads) relies on.
+MAX_CONCURRENT_CLONES = 4
+_clone_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_CLONES, thread_name_prefix="actsense-clone"
+)
+
+
+def _start_log_listener() -> Tuple[QueueListener, List[logging.Handler]]:
+    """Move the root logger's handlers onto a background thread.
+
+    Log calls on the event loop then only enqueue the record. Without root
+    handlers, a stderr handler stands in for logging's last-resort handler.
+    Returns the listener and the handlers to restore afterwards.
+    """
+    root = logging.getLogger()
+    original = root.handlers[:]
+    handlers = original
+    if not handlers:
+        fallback = logging.StreamHandler()
+        fallback.setLevel(logging.WARNING)
+        handlers = [fallback]
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in original:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener, original
+
+
+def _stop_log_listener(listener: QueueListener, original: List[logging.Handler]) -> None:
+    """Flush queued records and give the root logger its handlers back."""
+    listener.stop()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in original:
+        root.addHandler(handler)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared GitHub connection pool for the lifetime of the app."""
+    global _http_client, _audit_pool
+    log_listener = _start_log_listener()
+    _audit_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+    _http_client = httpx.AsyncClient(
+        # HTTP/2 multiplexes an audit's many small requests over one TLS
+        # connection per host; it needs the h2 package (httpx[http2]).
+        http2=HTTP2_AVAILABLE,
+        timeout=10.0,
+        # httpx drops idle connections after 5s by default; keep them for a
+        # minute so the next audit skips DNS and the TLS handshake.
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0),
+    )
+    try:
+        yield
+    finally:
+        await _http_client.aclose()
+        _http_client = None
+        _audit_pool.shutdown(wait=False, cancel_futures=True)
+        _audit_pool = None
+        # Analyses are written in the background; let queued ones land
+        await asyncio.to_thread(storage.flush)
+        _stop_log_listener(*log_listener)
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson, which is much faster on large graphs.
+
+    Endpoints returning a graph build this response themselves: FastAPI only
+    runs its pure-Python jsonable_encoder pass over plain return values.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _sse_json(payload: Any) -> str:
+    """Serialize an SSE data payload with orjson."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 app = FastAPI(
     title="actsense - GitHub Actions Security Auditor",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
 # CORS middleware — origins configurable via CORS_ORIGINS env var (comma-separated).
@@ -43,16 +172,101 @@ app.add_middleware(
 )
 
 parser = WorkflowParser()
+parser.set_action_store(ParsedActionCache())
 auditor = SecurityAuditor()
 cloner = RepoCloner()
 storage = AnalysisStorage()
+commit_cache = CommitMetadataCache()
 logger = logging.getLogger(__name__)
 
 # Serve frontend static files if they exist (for production builds)
 # This must be added AFTER API routes
-FRONTEND_BUILD_PATH = os.path.join(os.path.dirname(__file__), "..", "frontend", "dist")
-if os.path.exists(FRONTEND_BUILD_PATH):
-    app.mount("/static", StaticFiles(directory=os.path.join(FRONTEND_BUILD_PATH, "assets")), name="static")
+FRONTEND_BUILD_PATH = Path(__file__).resolve().parent.parent / "frontend" / "dist"
+if FRONTEND_BUILD_PATH.exists():
+    app.mount("/static", StaticFiles(directory=FRONTEND_BUILD_PATH / "assets"), name="static")
+
+
+# Frontend files up to this size are read once at startup and served from memory
+STATIC_CACHE_MAX_SIZE = 256 * 1024
+# Vite emits content-hashed bundles under assets/, so they never change in
+# place; everything else (index.html above all) must be revalidated.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class _CachedStaticFile(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+
+
+class SPAStaticFiles(StaticFiles):
+    """StaticFiles that answers unknown non-API paths with index.html for SPA routing.
+
+    Small files are kept in memory, so the common requests (index.html and
+    the hashed bundles) need no stat or open. Larger files go through
+    StaticFiles as usual, and client-side routes, which match no file in
+    the build, get index.html without touching the filesystem.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # path relative to the build directory -> preloaded file
+        self._cached: Dict[str, _CachedStaticFile] = {}
+        # paths of the files too large to preload
+        self._uncached: Set[str] = set()
+        root = Path(self.directory)
+        for file_path in root.rglob("*"):
+            if not file_path.is_file():
+                continue
+            if file_path.stat().st_size > STATIC_CACHE_MAX_SIZE:
+                self._uncached.add(file_path.relative_to(root).as_posix())
+                continue
+            body = file_path.read_bytes()
+            relative_path = file_path.relative_to(root).as_posix()
+            media_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+            if media_type.startswith("text/"):
+                media_type += "; charset=utf-8"
+            self._cached[relative_path] = _CachedStaticFile(body, {
+                "content-type": media_type,
+                "etag": f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"',
+                "cache-control": (
+                    _IMMUTABLE_CACHE_CONTROL if relative_path.startswith("assets/") else _REVALIDATE_CACHE_CONTROL
+                ),
+            })
+
+    async def get_response(self, path: str, scope) -> Response:
+        if path == "api" or path.startswith("api/"):
+            raise HTTPException(status_code=404, detail="Not found")
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        cached = self._cached.get("index.html" if path in ("", ".") else path)
+        if cached is None:
+            if path.replace(os.sep, "/") in self._uncached:
+                try:
+                    return await super().get_response(path, scope)
+                except StarletteHTTPException as exc:
+                    if exc.status_code != 404:
+                        raise
+            cached = self._cached.get("index.html")
+            if cached is None:
+                return await super().get_response("index.html", scope)
+        if Headers(scope=scope).get("if-none-match") == cached.headers["etag"]:
+            return Response(status_code=304, headers={
+                "etag": cached.headers["etag"],
+                "cache-control": cached.headers["cache-control"],
+            })
+        return Response(cached.body, headers=cached.headers)
+
+
+def _new_github_client(token: Optional[str]) -> GitHubClient:
+    """Create a GitHubClient on the shared connection pool, when it is open."""
+    return GitHubClient(
+        token=token,
+        commit_cache=commit_cache,
+        http_client=_http_client,
+        response_cache=_response_cache,
+        inflight=_inflight_requests,
+    )
 
 
 class AuditRequest(BaseModel):
@@ -67,20 +281,188 @@ class AuditYAMLRequest(BaseModel):
     github_token: Optional[str] = None
 
 
+# Number of worker tasks draining the dependency queue; GitHubClient separately
+# caps how many of their requests are on the wire at once.
+RESOLVE_WORKERS = 8
+# How many levels of action dependencies are followed below a workflow
+MAX_RESOLVE_DEPTH = 5
+# Cap on distinct actions resolved per audit (the size of its shared
+# ``visited`` set), so wide fan-out cannot make an audit run unbounded
+MAX_RESOLVED_ACTIONS = 500
+# runs.using values whose entry point is fetched for the JS audit rules
+_JS_ACTION_RUNTIMES = frozenset({"node12", "node16", "node20"})
+
+
 async def resolve_action_dependencies(
     client: GitHubClient,
     action_ref: str,
     graph: GraphBuilder,
     visited: Set[str],
     depth: int = 0,
-    max_depth: int = 5,
+    max_depth: int = MAX_RESOLVE_DEPTH,
     log_fn: Optional[Callable[[str], None]] = None
 ):
-    """Recursively resolve action dependencies."""
-    if depth > max_depth or action_ref in visited:
+    """Resolve an action and, breadth-first, everything it depends on."""
+    await _resolve_breadth_first(client, [(action_ref, depth)], graph, visited, max_depth, log_fn)
+
+
+async def _resolve_dependencies(
+    client: GitHubClient,
+    parent_id: str,
+    dependencies: List[str],
+    graph: GraphBuilder,
+    visited: Set[str],
+    depth: int = 0,
+    max_depth: int = MAX_RESOLVE_DEPTH,
+    log_fn: Optional[Callable[[str], None]] = None
+):
+    """Link parent_id to each dependency and resolve the dependencies."""
+    graph.add_edges(parent_id, dependencies)
+    await _prefetch_action_metadata(client, dependencies, visited)
+    await _resolve_breadth_first(
+        client, [(dep, depth) for dep in dependencies], graph, visited, max_depth, log_fn
+    )
+
+
+async def _prefetch_action_metadata(client: GitHubClient, dependencies: List[str], visited: Set[str]):
+    """Batch-fetch action.yml for the not-yet-visited actions among dependencies.
+
+    This only warms the client's cache with one GraphQL query; any failure is
+    ignored and the actions are then fetched one by one over REST.
+    """
+    actions = []
+    for dep in dependencies:
+        if dep in visited or dep.startswith("docker://"):
+            continue
+        owner, repo, _, subdir = client.parse_action_reference(dep)
+        if not owner or not repo:
+            continue
+        if subdir and (".github/workflows" in subdir or subdir.endswith(WORKFLOW_SUFFIXES)):
+            continue
+        actions.append((owner, repo, subdir))
+    if not actions:
+        return
+    try:
+        await client.prefetch_action_metadata(actions)
+    except Exception:
+        pass
+
+
+async def _resolve_breadth_first(
+    client: GitHubClient,
+    seeds: List[Tuple[str, int]],
+    graph: GraphBuilder,
+    visited: Set[str],
+    max_depth: int,
+    log_fn: Optional[Callable[[str], None]]
+):
+    """Resolve (action_ref, depth) seeds and their dependencies with a worker pool.
+
+    Workers pop an action, resolve it, link it to its dependencies and queue
+    those one level deeper. _resolve_action marks an action visited before
+    its first await, so an action reached from several places (including
+    other workflows sharing ``visited``) is fetched once.
+    """
+    # Popular actions (actions/checkout, ...) are reached from many places;
+    # only queue those that still need resolving.
+    seeds = [(action_ref, depth) for action_ref, depth in seeds if action_ref not in visited]
+    if not seeds:
         return
     
+    queue: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()
+    for seed in seeds:
+        queue.put_nowait(seed)
+    
+    async def worker():
+        while True:
+            action_ref, depth = await queue.get()
+            try:
+                deps = await _resolve_action(client, action_ref, graph, visited, depth, max_depth, log_fn)
+                graph.add_edges(action_ref, deps)
+                if depth < max_depth:
+                    # An action's dependencies (a composite action's steps)
+                    # are fetched in one GraphQL batch before they are queued
+                    await _prefetch_action_metadata(client, deps, visited)
+                    for dep in deps:
+                        if dep not in visited:
+                            queue.put_nowait((dep, depth + 1))
+            except Exception:
+                # One bad action must not stop the rest of the graph
+                logger.debug("Failed to resolve action", exc_info=True, extra={"action": action_ref, "depth": depth})
+            finally:
+                queue.task_done()
+    
+    workers = [asyncio.create_task(worker()) for _ in range(RESOLVE_WORKERS)]
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _audit_action(
+    auditor: SecurityAuditor,
+    action_ref: str,
+    action_yml: Optional[Dict[str, Any]],
+    js_action_code: Optional[str],
+    dockerfile_content: Optional[str],
+    action_yml_content: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Audit an action, scanning large bundles in a worker process.
+
+    SecurityAuditor.audit_action is a stateless staticmethod, so it pickles by
+    reference. Small payloads stay on the event loop, where they are cheaper
+    to scan than to ship to a worker. Results are cached by content when the
+    action.yml text is given (action_yml is parsed from it).
+    """
+    key = None
+    if action_yml_content is not None:
+        digest = hashlib.sha256()
+        for part in (action_ref, action_yml_content, js_action_code, dockerfile_content):
+            # Length-prefixed so part boundaries (and None) are unambiguous
+            data = b"" if part is None else part.encode("utf-8", "surrogatepass")
+            digest.update(b"-" if part is None else str(len(data)).encode())
+            digest.update(b":" + data)
+        key = digest.digest()
+        cached = _audit_results.get(key)
+        if cached is not None:
+            _audit_results.move_to_end(key)
+            return [dict(issue) for issue in cached]
+    
+    size = len(js_action_code or "") + len(dockerfile_content or "")
+    if _audit_pool is None or size < AUDIT_OFFLOAD_MIN_SIZE:
+        issues = auditor.audit_action(action_ref, action_yml, js_action_code, dockerfile_content)
+    else:
+        loop = asyncio.get_running_loop()
+        issues = await loop.run_in_executor(
+            _audit_pool, SecurityAuditor.audit_action, action_ref, action_yml, js_action_code, dockerfile_content
+        )
+    
+    if key is not None:
+        _audit_results[key] = [dict(issue) for issue in issues]
+        if len(_audit_results) > AUDIT_RESULT_CACHE_SIZE:
+            _audit_results.popitem(last=False)
+    return issues
+
+
+async def _resolve_action(
+    client: GitHubClient,
+    action_ref: str,
+    graph: GraphBuilder,
+    visited: Set[str],
+    depth: int,
+    max_depth: int,
+    log_fn: Optional[Callable[[str], None]]
+) -> List[str]:
+    """Add one action to the graph, audit it, and return its direct dependencies."""
+    if action_ref in visited or depth > max_depth:
+        return []
+    
     _log = log_fn or (lambda _: None)
+    if len(visited) >= MAX_RESOLVED_ACTIONS:
+        _log(f"Skipping {action_ref}: audit limit of {MAX_RESOLVED_ACTIONS} actions reached")
+        return []
     visited.add(action_ref)
     _log(f"Resolving {action_ref}")
     
@@ -90,15 +472,15 @@ async def resolve_action_dependencies(
         issues = auditor.audit_action(action_ref, None, None, None)
         if issues:
             graph.add_issues_to_node(action_ref, issues)
-        return
+        return []
     
     # Parse action reference
     owner, repo, ref, subdir = client.parse_action_reference(action_ref)
     if not owner or not repo:
-        return
+        return []
     
     # Handle reusable workflows
-    if subdir and (".github/workflows" in subdir or subdir.endswith((".yml", ".yaml"))):
+    if subdir and (".github/workflows" in subdir or subdir.endswith(WORKFLOW_SUFFIXES)):
         display_name = f"{owner}/{repo}/{subdir}@{ref}"
         graph.add_node(action_ref, display_name, "reusable_workflow", {"owner": owner, "repo": repo, "ref": ref, "subdir": subdir})
         try:
@@ -108,13 +490,10 @@ async def resolve_action_dependencies(
                 workflow_issues = await auditor.audit_workflow(workflow, content=workflow_content, client=client)
                 if workflow_issues:
                     graph.add_issues_to_node(action_ref, workflow_issues)
-                dependencies = parser.extract_actions(workflow)
-                for dep in dependencies:
-                    graph.add_edge(action_ref, dep)
-                    await resolve_action_dependencies(client, dep, graph, visited, depth + 1, max_depth, log_fn)
+                return parser.extract_actions(workflow)
         except Exception:
             pass
-        return
+        return []
     
     # Add node to graph
     display_name = f"{owner}/{repo}"
@@ -129,6 +508,10 @@ async def resolve_action_dependencies(
         {"owner": owner, "repo": repo, "ref": ref, "subdir": subdir}
     )
     
+    # The action.yml request does not depend on the repository check, so both
+    # go out together; the metadata is dropped if the repository is missing.
+    metadata_task = asyncio.ensure_future(client.get_action_metadata(owner, repo, ref, subdir))
+    
     # Check if repository exists
     repo_key = f"{owner}/{repo}"
     repo_exists = None
@@ -138,10 +521,15 @@ async def resolve_action_dependencies(
     except HTTPException:
         # For API errors (rate limits, network issues), don't assume repo is missing
         # Skip this check rather than marking as missing
-        return
+        _cancel_pending([metadata_task])
+        return []
     except Exception:
         # For other unexpected errors, don't assume repo is missing
-        return
+        _cancel_pending([metadata_task])
+        return []
+    except BaseException:
+        _cancel_pending([metadata_task])
+        raise
     
     # If repository doesn't exist, add a critical issue
     if repo_exists is False:
@@ -159,33 +547,36 @@ async def resolve_action_dependencies(
             "recommendation": f"Verify the action reference '{action_ref}' is correct. The repository '{repo_key}' may have been deleted, moved, made private, or the reference may contain a typo. Update the workflow to use a valid action reference."
         }
         graph.add_issues_to_node(action_ref, [missing_repo_issue])
-        # Don't try to fetch metadata if repository doesn't exist
-        return
+        # Don't use metadata if repository doesn't exist
+        _cancel_pending([metadata_task])
+        return []
+    
+    # Prefix for paths inside the action's directory
+    subdir_prefix = f"{subdir.rstrip('/')}/" if subdir else ""
     
     # Get action metadata first (needed for comprehensive auditing)
     action_yml = None
+    action_yml_content = None
     js_action_code = None
     dockerfile_content = None
     try:
-        action_metadata = await client.get_action_metadata(owner, repo, ref, subdir)
+        action_metadata = await metadata_task
         if action_metadata:
-            action_yml = parser.parse_action_yml(action_metadata["content"])
+            action_yml_content = action_metadata["content"]
+            action_yml = parser.parse_action_yml(action_yml_content)
             
             runs = action_yml.get("runs", {})
             
             # For JavaScript actions, try to get the main entry point code
-            if runs.get("using") in ["node12", "node16", "node20"]:
-                main_file = runs.get("main", "index.js")
-                if subdir:
-                    main_path = f"{subdir.rstrip('/')}/{main_file}"
-                else:
-                    main_path = main_file
+            using = runs.get("using")
+            if using in _JS_ACTION_RUNTIMES:
+                main_path = subdir_prefix + runs.get("main", "index.js")
                 
                 try:
                     js_action_code = await client.get_file_content(owner, repo, main_path)
                 except Exception:
                     # If main file doesn't exist, try dist/index.js or index.js in root
-                    for alt_path in [f"{subdir.rstrip('/')}/dist/index.js" if subdir else "dist/index.js", "index.js"]:
+                    for alt_path in (f"{subdir_prefix}dist/index.js", "index.js"):
                         try:
                             js_action_code = await client.get_file_content(owner, repo, alt_path)
                             break
@@ -193,20 +584,17 @@ async def resolve_action_dependencies(
                             continue
             
             # For Docker actions, try to get Dockerfile content if Dockerfile path is specified
-            elif runs.get("using") == "docker":
+            elif using == "docker":
                 dockerfile_path = runs.get("image", "")
                 if dockerfile_path and not dockerfile_path.startswith("docker://") and ":" not in dockerfile_path:
                     # This is likely a Dockerfile path
-                    if subdir:
-                        dockerfile_full_path = f"{subdir.rstrip('/')}/{dockerfile_path}"
-                    else:
-                        dockerfile_full_path = dockerfile_path
+                    dockerfile_full_path = subdir_prefix + dockerfile_path
                     
                     try:
                         dockerfile_content = await client.get_file_content(owner, repo, dockerfile_full_path)
                     except Exception:
                         # Try common Dockerfile names
-                        for alt_name in ["Dockerfile", "dockerfile", f"{subdir.rstrip('/')}/Dockerfile" if subdir else "Dockerfile"]:
+                        for alt_name in ("Dockerfile", "dockerfile", f"{subdir_prefix}Dockerfile"):
                             try:
                                 dockerfile_content = await client.get_file_content(owner, repo, alt_name)
                                 break
@@ -218,23 +606,20 @@ async def resolve_action_dependencies(
     
     # Audit the action (with metadata if available)
     # action_content parameter expects JavaScript code for JS actions, not action.yml content
-    issues = auditor.audit_action(action_ref, action_yml, js_action_code, dockerfile_content)
+    issues = await _audit_action(
+        auditor, action_ref, action_yml, js_action_code, dockerfile_content, action_yml_content
+    )
     graph.add_issues_to_node(action_ref, issues)
     _add_package_dependency_nodes(graph, action_ref, issues)
     
     # Resolve dependencies if action_yml is available
     if action_yml:
         try:
-            dependencies = parser.extract_action_dependencies(action_yml)
-            
-            for dep in dependencies:
-                graph.add_edge(action_ref, dep)
-                await resolve_action_dependencies(
-                    client, dep, graph, visited, depth + 1, max_depth, log_fn
-                )
+            return parser.extract_action_dependencies(action_yml)
         except Exception as e:
             # Silently skip if there's an error resolving dependencies
             pass
+    return []
 
 
 def _add_workflow_container_image_nodes(
@@ -318,6 +703,9 @@ async def audit_repository(
     # use the repository's real default branch when available.
     default_branch = "main"
     is_public_repo = False
+    # The workflow listing does not depend on the repository metadata, so
+    # both requests go out together.
+    workflows_task = None if use_clone else asyncio.ensure_future(client.get_workflows(owner, repo))
     _log(f"Checking repository metadata for {owner}/{repo}")
     try:
         repo_info = await client.get_repository_info(owner, repo)
@@ -344,124 +732,114 @@ async def audit_repository(
     current_repo = f"{owner}/{repo}"
     
     clone_path = None
-    workflow_actions_data = []  # Collect actions from all workflows for inconsistency checking
+    visited: Set[str] = set()
+
+    async def process_workflow(workflow_file: Dict[str, Any], load_content) -> Optional[Dict[str, Any]]:
+        """Audit one workflow file; return its actions for the consistency check."""
+        try:
+            _log(f"Parsing {workflow_file['name']}")
+            content = await load_content(workflow_file["path"])
+            workflow = parser.parse_workflow(content)
+            
+            if not isinstance(workflow, dict) or "error" in workflow:
+                return None
+            
+            _log(f"Auditing {workflow_file['name']}")
+            workflow_issues = await auditor.audit_workflow(workflow, content=content, client=client, current_repo=current_repo, is_public_repo=is_public_repo, log_fn=log_fn)
+            workflow_node_id = f"{repo_node_id}:{workflow_file['name']}"
+            graph.add_node(
+                workflow_node_id,
+                workflow_file["name"],
+                "workflow",
+                {"path": workflow_file["path"]}
+            )
+            graph.add_edge(repo_node_id, workflow_node_id)
+            graph.add_issues_to_node(workflow_node_id, workflow_issues)
+            _add_package_dependency_nodes(graph, workflow_node_id, workflow_issues)
+            
+            # Extract actions; they are resolved once every workflow is parsed
+            actions = parser.extract_actions(workflow)
+            for action in actions:
+                graph.add_edge(workflow_node_id, action)
+            
+            # Collect actions for inconsistency checking
+            actions_data = {
+                'workflow_name': workflow_file['name'],
+                'workflow_path': workflow_file['path'],
+                'actions': actions
+            }
+            
+            _add_workflow_container_image_nodes(
+                graph, workflow, workflow_node_id, workflow_issues
+            )
+            return actions_data
+        except Exception as e:
+            logger.warning(
+                "Failed to process workflow",
+                exc_info=True,
+                extra={"workflow": workflow_file["name"], "repository": repo_node_id},
+            )
+            _log(f"Error processing {workflow_file['name']}: {e}")
+            graph.add_issues_to_node(repo_node_id, [{
+                "type": "workflow_processing_error",
+                "severity": "low",
+                "message": f"Failed to process workflow '{workflow_file['name']}': {e}",
+                "evidence": {"workflow": workflow_file["name"], "error": str(e)},
+                "recommendation": "Check if the workflow file is valid YAML and accessible."
+            }])
+            return None
     
     try:
         if use_clone:
             _log(f"Cloning {owner}/{repo}...")
-            clone_path, _ = cloner.clone_repository(owner, repo, token)
-            workflows = cloner.get_workflow_files(clone_path)
+            # git and the file system block; keep them off the event loop so
+            # other audits keep running
+            clone_path, _ = await asyncio.get_running_loop().run_in_executor(
+                _clone_executor, cloner.clone_repository, owner, repo, token
+            )
+            # Only the workflow files are needed: read them in one go and
+            # drop the clone before the (much longer) dependency resolution.
+            try:
+                workflow_contents = await asyncio.to_thread(cloner.read_workflow_files, clone_path)
+            finally:
+                await asyncio.to_thread(cloner.cleanup, clone_path)
+                clone_path = None
+            # Paths are ".github/workflows/<name>", so the name is the last segment
+            workflows = [
+                {"name": path.rpartition("/")[2], "path": path} for path in workflow_contents
+            ]
             _log(f"Found {len(workflows)} workflow(s)")
             
-            visited = set()
-            
-            for workflow_file in workflows:
-                try:
-                    _log(f"Parsing {workflow_file['name']}")
-                    content = cloner.get_file_content(clone_path, workflow_file["path"])
-                    workflow = parser.parse_workflow(content)
-                    
-                    if not isinstance(workflow, dict) or "error" in workflow:
-                        continue
-                    
-                    _log(f"Auditing {workflow_file['name']}")
-                    workflow_issues = await auditor.audit_workflow(workflow, content=content, client=client, current_repo=current_repo, is_public_repo=is_public_repo, log_fn=log_fn)
-                    workflow_node_id = f"{repo_node_id}:{workflow_file['name']}"
-                    graph.add_node(
-                        workflow_node_id,
-                        workflow_file["name"],
-                        "workflow",
-                        {"path": workflow_file["path"]}
-                    )
-                    graph.add_edge(repo_node_id, workflow_node_id)
-                    graph.add_issues_to_node(workflow_node_id, workflow_issues)
-                    _add_package_dependency_nodes(graph, workflow_node_id, workflow_issues)
-                    
-                    # Extract actions
-                    actions = parser.extract_actions(workflow)
-                    
-                    # Collect actions for inconsistency checking
-                    workflow_actions_data.append({
-                        'workflow_name': workflow_file['name'],
-                        'workflow_path': workflow_file['path'],
-                        'actions': actions
-                    })
-                    
-                    for action_ref in actions:
-                        graph.add_edge(workflow_node_id, action_ref)
-                        await resolve_action_dependencies(
-                            client, action_ref, graph, visited, log_fn=log_fn
-                        )
-                    
-                    _add_workflow_container_image_nodes(
-                        graph, workflow, workflow_node_id, workflow_issues
-                    )
-                except Exception as e:
-                    _log(f"Error processing {workflow_file['name']}: {e}")
-                    graph.add_issues_to_node(repo_node_id, [{
-                        "type": "workflow_processing_error",
-                        "severity": "low",
-                        "message": f"Failed to process workflow '{workflow_file['name']}': {e}",
-                        "evidence": {"workflow": workflow_file["name"], "error": str(e)},
-                        "recommendation": "Check if the workflow file is valid YAML and accessible."
-                    }])
+            async def load_content(path: str) -> str:
+                content = workflow_contents[path]
+                # A file that could not be read is reported by process_workflow
+                if isinstance(content, Exception):
+                    raise content
+                return content
         else:
             _log(f"Fetching workflows via API...")
-            workflows = await client.get_workflows(owner, repo)
+            workflows = await workflows_task
             _log(f"Found {len(workflows)} workflow(s)")
             
-            visited = set()
-            
-            for workflow_file in workflows:
-                try:
-                    _log(f"Parsing {workflow_file['name']}")
-                    content = await client.get_file_content(owner, repo, workflow_file["path"])
-                    workflow = parser.parse_workflow(content)
-                    
-                    if not isinstance(workflow, dict) or "error" in workflow:
-                        continue
-                    
-                    _log(f"Auditing {workflow_file['name']}")
-                    workflow_issues = await auditor.audit_workflow(workflow, content=content, client=client, current_repo=current_repo, is_public_repo=is_public_repo, log_fn=log_fn)
-                    workflow_node_id = f"{repo_node_id}:{workflow_file['name']}"
-                    graph.add_node(
-                        workflow_node_id,
-                        workflow_file["name"],
-                        "workflow",
-                        {"path": workflow_file["path"]}
-                    )
-                    graph.add_edge(repo_node_id, workflow_node_id)
-                    graph.add_issues_to_node(workflow_node_id, workflow_issues)
-                    _add_package_dependency_nodes(graph, workflow_node_id, workflow_issues)
-                    
-                    # Extract actions
-                    actions = parser.extract_actions(workflow)
-                    
-                    # Collect actions for inconsistency checking
-                    workflow_actions_data.append({
-                        'workflow_name': workflow_file['name'],
-                        'workflow_path': workflow_file['path'],
-                        'actions': actions
-                    })
-                    
-                    for action_ref in actions:
-                        graph.add_edge(workflow_node_id, action_ref)
-                        await resolve_action_dependencies(
-                            client, action_ref, graph, visited, log_fn=log_fn
-                        )
-                    
-                    _add_workflow_container_image_nodes(
-                        graph, workflow, workflow_node_id, workflow_issues
-                    )
-                except Exception as e:
-                    _log(f"Error processing {workflow_file['name']}: {e}")
-                    graph.add_issues_to_node(repo_node_id, [{
-                        "type": "workflow_processing_error",
-                        "severity": "low",
-                        "message": f"Failed to process workflow '{workflow_file['name']}': {e}",
-                        "evidence": {"workflow": workflow_file["name"], "error": str(e)},
-                        "recommendation": "Check if the workflow file is valid YAML and accessible."
-                    }])
+            async def load_content(path: str) -> str:
+                return await client.get_file_content(owner, repo, path)
+        
+        # Workflows are independent, so audit them concurrently; results come
+        # back in workflow order for the consistency check below.
+        results = await asyncio.gather(
+            *(process_workflow(workflow_file, load_content) for workflow_file in workflows)
+        )
+        workflow_actions_data = [data for data in results if data is not None]
+        
+        # Resolve all workflows' actions from one queue: actions shared
+        # between workflows go into a single prefetch batch and one worker pool.
+        all_actions = list(dict.fromkeys(
+            action for data in workflow_actions_data for action in data["actions"]
+        ))
+        await _prefetch_action_metadata(client, all_actions, visited)
+        await _resolve_breadth_first(
+            client, [(action, 0) for action in all_actions], graph, visited, MAX_RESOLVE_DEPTH, log_fn
+        )
         
         _log("Checking version consistency across workflows")
         # Check for inconsistent action versions across workflows
@@ -470,15 +848,52 @@ async def audit_repository(
             if inconsistency_issues:
                 graph.add_issues_to_node(repo_node_id, inconsistency_issues)
     finally:
+        if workflows_task is not None and not workflows_task.done():
+            workflows_task.cancel()
         # Cleanup cloned repository
         if clone_path:
-            cloner.cleanup(clone_path)
+            await asyncio.to_thread(cloner.cleanup, clone_path)
+
+
+# Matches "owner/repo" and https://[www.]github.com/owner/repo[.git][/...] in
+# one pass; anything else falls through to _parse_repository's error path.
+_REPO_RE = re.compile(
+    r"^(?:https?://(?:www\.)?github\.com/([^/?#\s]+)/([^/?#\s]+?)(?:\.git)?(?:[/?#].*)?"
+    r"|([^/:\s]+)/([^/:\s]+))$"
+)
+
+
+def _parse_repository(repo_str: str) -> Tuple[str, str]:
+    """Split a repository string (owner/repo or github.com URL) into owner and repo."""
+    match = _REPO_RE.match(repo_str)
+    if match:
+        if match.group(1):
+            return match.group(1), match.group(2)
+        return match.group(3), match.group(4)
+    
+    # Slow path: work out which error to report.
+    parsed_url = urlparse(repo_str)
+    if parsed_url.scheme and parsed_url.netloc:
+        # Allow both github.com and www.github.com
+        if parsed_url.netloc not in ("github.com", "www.github.com"):
+            raise HTTPException(status_code=400, detail="Only github.com repository URLs are supported")
+        raise HTTPException(status_code=400, detail="Invalid repository URL")
+    raise HTTPException(status_code=400, detail="Invalid repository format. Use 'owner/repo'")
+
+
+def _finalize_graph(graph: GraphBuilder) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Reduce the finished graph and tally its statistics.
+
+    The edge reduction is the only super-linear step of an audit, so callers
+    run this on a worker thread once resolution is done.
+    """
+    return graph.get_graph_data(), graph.get_statistics()
 
 
 @app.post("/api/audit")
 async def audit(request: AuditRequest):
     """Audit a repository or action."""
-    client = GitHubClient(token=request.github_token)
+    client = _new_github_client(request.github_token)
     graph = GraphBuilder()
     
     try:
@@ -487,23 +902,7 @@ async def audit(request: AuditRequest):
         
         if request.repository:
             # Parse repository: owner/repo or full URL
-            repo_str = request.repository
-            # Check if repo_str is a full GitHub URL
-            parsed_url = urlparse(repo_str)
-            if parsed_url.scheme and parsed_url.netloc:
-                # Allow both github.com and www.github.com
-                if parsed_url.netloc not in ("github.com", "www.github.com"):
-                    raise HTTPException(status_code=400, detail="Only github.com repository URLs are supported")
-                path_parts = parsed_url.path.strip("/").split("/")
-                if len(path_parts) < 2:
-                    raise HTTPException(status_code=400, detail="Invalid repository URL")
-                owner, repo = path_parts[0], path_parts[1].replace(".git", "")
-            else:
-                # Not a full URL, treat as owner/repo format
-                parts = repo_str.split("/")
-                if len(parts) != 2:
-                    raise HTTPException(status_code=400, detail="Invalid repository format. Use 'owner/repo'")
-                owner, repo = parts
+            owner, repo = _parse_repository(request.repository)
             
             repository = f"{owner}/{repo}"
             await audit_repository(client, owner, repo, graph, request.use_clone, request.github_token)
@@ -517,11 +916,10 @@ async def audit(request: AuditRequest):
         else:
             raise HTTPException(status_code=400, detail="Either repository or action must be provided")
         
-        graph_data = graph.get_graph_data()
-        statistics = graph.get_statistics()
+        graph_data, statistics = await asyncio.to_thread(_finalize_graph, graph)
         
-        # Save analysis
-        analysis_id = storage.save_analysis(
+        # Save analysis off the request path; it is readable right away
+        analysis_id = storage.save_analysis_in_background(
             repository=repository,
             action=action,
             graph_data=graph_data,
@@ -529,11 +927,11 @@ async def audit(request: AuditRequest):
             method="clone" if request.use_clone else "api"
         )
         
-        return {
+        return OrjsonResponse({
             "id": analysis_id,
             "graph": graph_data,
             "statistics": statistics
-        }
+        })
     
     except HTTPException:
         raise
@@ -542,6 +940,8 @@ async def audit(request: AuditRequest):
     except Exception:
         logger.exception("Unexpected error during repository audit")
         raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        await client.aclose()
 
 
 @app.post("/api/audit/stream")
@@ -554,27 +954,14 @@ async def audit_stream(request: AuditRequest):
 
     async def run_audit():
         """Execute the audit and push the result (or error) onto the queue."""
-        client = GitHubClient(token=request.github_token)
+        client = _new_github_client(request.github_token)
         graph = GraphBuilder()
         try:
             repository = None
             action = None
 
             if request.repository:
-                repo_str = request.repository
-                parsed_url = urlparse(repo_str)
-                if parsed_url.scheme and parsed_url.netloc:
-                    if parsed_url.netloc not in ("github.com", "www.github.com"):
-                        raise HTTPException(status_code=400, detail="Only github.com repository URLs are supported")
-                    path_parts = parsed_url.path.strip("/").split("/")
-                    if len(path_parts) < 2:
-                        raise HTTPException(status_code=400, detail="Invalid repository URL")
-                    owner, repo = path_parts[0], path_parts[1].replace(".git", "")
-                else:
-                    parts = repo_str.split("/")
-                    if len(parts) != 2:
-                        raise HTTPException(status_code=400, detail="Invalid repository format. Use 'owner/repo'")
-                    owner, repo = parts
+                owner, repo = _parse_repository(request.repository)
 
                 repository = f"{owner}/{repo}"
                 await audit_repository(client, owner, repo, graph, request.use_clone, request.github_token, log_fn=log_callback)
@@ -587,10 +974,9 @@ async def audit_stream(request: AuditRequest):
                 raise HTTPException(status_code=400, detail="Either repository or action must be provided")
 
             log_callback("Building final graph...")
-            graph_data = graph.get_graph_data()
-            statistics = graph.get_statistics()
+            graph_data, statistics = await asyncio.to_thread(_finalize_graph, graph)
 
-            analysis_id = storage.save_analysis(
+            analysis_id = storage.save_analysis_in_background(
                 repository=repository,
                 action=action,
                 graph_data=graph_data,
@@ -607,6 +993,8 @@ async def audit_stream(request: AuditRequest):
         except Exception:
             logger.exception("Unexpected error during streaming audit")
             log_queue.put_nowait(("__ERROR__", "Internal server error"))
+        finally:
+            await client.aclose()
 
     async def event_generator():
         task = asyncio.create_task(run_audit())
@@ -618,13 +1006,13 @@ async def audit_stream(request: AuditRequest):
                 if isinstance(msg, tuple):
                     kind, payload = msg
                     if kind == "__RESULT__":
-                        yield f"event: result\ndata: {json.dumps(payload)}\n\n"
+                        yield f"event: result\ndata: {_sse_json(payload)}\n\n"
                         break
                     elif kind == "__ERROR__":
-                        yield f"event: error\ndata: {json.dumps({'detail': payload})}\n\n"
+                        yield f"event: error\ndata: {_sse_json({'detail': payload})}\n\n"
                         break
                 else:
-                    yield f"event: log\ndata: {json.dumps({'message': msg})}\n\n"
+                    yield f"event: log\ndata: {_sse_json({'message': msg})}\n\n"
         finally:
             if not task.done():
                 task.cancel()
@@ -632,11 +1020,18 @@ async def audit_stream(request: AuditRequest):
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
+# Patterns used while building auto-fix suggestions
+_HEX_RE = re.compile(r'^[a-f0-9]+$')
+# A YAML value of 20+ token characters at the end of a line, for secret fixes
+_HARDCODED_VALUE_RE = re.compile(r'(:\s*)["\']?([a-zA-Z0-9_\-]{20,})["\']?\s*$')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+
+
 @app.post("/api/audit/fix")
 async def audit_fix(request: AuditYAMLRequest):
     """Audit YAML and return issues with concrete auto-fix suggestions."""
     try:
-        parsed_yaml = yaml.safe_load(request.yaml_content)
+        parsed_yaml = parser.load_yaml(request.yaml_content)
         if parsed_yaml is None:
             raise HTTPException(status_code=400, detail="YAML file is empty")
     except yaml.YAMLError as e:
@@ -644,12 +1039,16 @@ async def audit_fix(request: AuditYAMLRequest):
         msg = f"YAML syntax error at line {line_num}" if line_num else "YAML syntax error"
         raise HTTPException(status_code=400, detail=msg)
 
-    workflow = parser.parse_workflow(request.yaml_content)
-    if not isinstance(workflow, dict) or "error" in workflow:
-        raise HTTPException(status_code=400, detail="Invalid workflow YAML")
+    # Parsed once above; non-mapping documents audit as an empty workflow,
+    # as parse_workflow would return
+    workflow = parsed_yaml if isinstance(parsed_yaml, dict) else {}
 
-    client = GitHubClient(token=request.github_token)
-    issues = await auditor.audit_workflow(workflow, content=request.yaml_content, client=client)
+    client = _new_github_client(request.github_token)
+    try:
+        issues = await auditor.audit_workflow(workflow, content=request.yaml_content, client=client)
+    except Exception:
+        await client.aclose()
+        raise
 
     lines = request.yaml_content.split('\n')
     fixes = []
@@ -666,7 +1065,7 @@ async def audit_fix(request: AuditYAMLRequest):
             if not action_ref or "@" not in action_ref:
                 continue
             action_name, tag = action_ref.rsplit("@", 1)
-            if len(tag) >= 7 and re.match(r'^[a-f0-9]+$', tag):
+            if len(tag) >= 7 and _HEX_RE.match(tag):
                 continue
             fix_key = f"pin:{action_ref}"
             if fix_key in seen_fixes:
@@ -1023,7 +1422,7 @@ async def audit_fix(request: AuditYAMLRequest):
             if line_num and 0 < line_num <= len(lines):
                 original_line = lines[line_num - 1]
                 # Replace the hardcoded value with a secrets reference
-                match = re.search(r'(:\s*)["\']?([a-zA-Z0-9_\-]{20,})["\']?\s*$', original_line)
+                match = _HARDCODED_VALUE_RE.search(original_line)
                 if match:
                     secret_name = evidence_path.split(".")[-1].upper() if evidence_path else "SECRET_VALUE"
                     replacement_line = original_line[:match.start(2)] + "${{ secrets." + secret_name + " }}" + original_line[match.end(2):]
@@ -1085,7 +1484,7 @@ async def audit_fix(request: AuditYAMLRequest):
                     expr = original_line[expr_start:expr_end + 2]
                     # Extract a reasonable env var name
                     inner = expr.strip("${ }")
-                    env_name = re.sub(r'[^a-zA-Z0-9]', '_', inner).upper()
+                    env_name = _NON_ALNUM_RE.sub('_', inner).upper()
                     if len(env_name) > 30:
                         env_name = env_name[:30]
                     indent = " " * (len(original_line) - len(original_line.lstrip()))
@@ -1134,6 +1533,7 @@ async def audit_fix(request: AuditYAMLRequest):
                     })
                     break
 
+    await client.aclose()
     return {"issues": issues, "fixes": fixes, "rate_limited": rate_limited}
 
 
@@ -1141,7 +1541,7 @@ async def _audit_yaml_body(request: AuditYAMLRequest) -> Dict[str, Any]:
     """Core YAML audit logic; raises HTTPException on client errors."""
     # Validate YAML syntax first
     try:
-        parsed_yaml = yaml.safe_load(request.yaml_content)
+        parsed_yaml = parser.load_yaml(request.yaml_content)
         if parsed_yaml is None:
             raise HTTPException(status_code=400, detail="YAML file is empty or contains no valid content")
     except yaml.YAMLError as e:
@@ -1152,64 +1552,59 @@ async def _audit_yaml_body(request: AuditYAMLRequest) -> Dict[str, Any]:
             error_msg = "YAML syntax error"
         raise HTTPException(status_code=400, detail=f"Invalid YAML syntax: {error_msg}")
 
-    workflow = parser.parse_workflow(request.yaml_content)
-
-    if "error" in workflow:
-        raise HTTPException(status_code=400, detail="Invalid workflow YAML")
-
-    if not isinstance(workflow, dict):
-        raise HTTPException(status_code=400, detail="Invalid workflow format: Expected a dictionary")
+    # Parsed once above; non-mapping documents count as an empty workflow,
+    # as parse_workflow would return
+    workflow = parsed_yaml if isinstance(parsed_yaml, dict) else {}
 
     if not workflow.get("jobs") and not workflow.get("on"):
         raise HTTPException(status_code=400, detail="Invalid workflow: Missing required 'jobs' or 'on' fields")
 
     graph = GraphBuilder()
-    client = GitHubClient(token=request.github_token)
-
-    workflow_node_id = "workflow:inline"
-    graph.add_node(
-        workflow_node_id,
-        "Inline Workflow",
-        "workflow",
-        {"path": "inline", "is_inline": True}
-    )
+    client = _new_github_client(request.github_token)
+    try:
+        workflow_node_id = "workflow:inline"
+        graph.add_node(
+            workflow_node_id,
+            "Inline Workflow",
+            "workflow",
+            {"path": "inline", "is_inline": True}
+        )
 
-    workflow_issues = await auditor.audit_workflow(
-        workflow,
-        content=request.yaml_content,
-        client=client
-    )
+        workflow_issues = await auditor.audit_workflow(
+            workflow,
+            content=request.yaml_content,
+            client=client
+        )
 
-    graph.add_issues_to_node(workflow_node_id, workflow_issues)
-    _add_package_dependency_nodes(graph, workflow_node_id, workflow_issues)
+        graph.add_issues_to_node(workflow_node_id, workflow_issues)
+        _add_package_dependency_nodes(graph, workflow_node_id, workflow_issues)
 
-    actions = parser.extract_actions(workflow)
-    visited = set()
+        actions = parser.extract_actions(workflow)
+        visited = set()
 
-    for action_ref in actions:
-        graph.add_edge(workflow_node_id, action_ref)
-        await resolve_action_dependencies(
-            client, action_ref, graph, visited, depth=0, max_depth=5
+        await _resolve_dependencies(
+            client, workflow_node_id, actions, graph, visited, depth=0, max_depth=MAX_RESOLVE_DEPTH
         )
 
-    _add_workflow_container_image_nodes(graph, workflow, workflow_node_id, workflow_issues)
+        _add_workflow_container_image_nodes(graph, workflow, workflow_node_id, workflow_issues)
 
-    graph_data = graph.get_graph_data()
-    statistics = graph.get_statistics()
+        graph_data, statistics = await asyncio.to_thread(_finalize_graph, graph)
 
-    analysis_id = storage.save_analysis(
-        repository=None,
-        action=None,
-        graph_data=graph_data,
-        statistics=statistics,
-        method="yaml"
-    )
+        analysis_id = storage.save_analysis_in_background(
+            repository=None,
+            action=None,
+            graph_data=graph_data,
+            statistics=statistics,
+            method="yaml"
+        )
+    finally:
+        await client.aclose()
 
-    return {
+    return OrjsonResponse({
         "id": analysis_id,
         "graph": graph_data,
         "statistics": statistics
-    }
+    })
 
 
 @app.post("/api/audit/yaml")
@@ -1244,38 +1639,31 @@ async def list_analyses(repository: Optional[str] = None, limit: int = 50):
 @app.get("/api/analyses/{analysis_id}")
 async def get_analysis(analysis_id: str):
     """Get a specific analysis by ID."""
-    analysis = storage.get_analysis(analysis_id)
+    # Reads the analysis and graph documents from disk; keep that off the loop
+    analysis = await asyncio.to_thread(storage.get_analysis, analysis_id)
     if not analysis:
         raise HTTPException(status_code=404, detail="Analysis not found")
-    return analysis
+    return OrjsonResponse(analysis)
 
 
 @app.delete("/api/analyses/{analysis_id}")
 async def delete_analysis(analysis_id: str):
     """Delete an analysis by ID."""
-    if storage.delete_analysis(analysis_id):
+    if await asyncio.to_thread(storage.delete_analysis, analysis_id):
         return {"status": "deleted"}
     raise HTTPException(status_code=404, detail="Analysis not found")
 
 
-# Serve frontend for all non-API routes (must be last)
-if os.path.exists(FRONTEND_BUILD_PATH):
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
-        """Serve frontend for all non-API routes."""
-        if full_path.startswith("api/"):
-            raise HTTPException(status_code=404, detail="Not found")
-        
-        # Normalize and check the path is within FRONTEND_BUILD_PATH
-        abs_frontend_root = os.path.abspath(FRONTEND_BUILD_PATH)
-        file_path = os.path.normpath(os.path.join(FRONTEND_BUILD_PATH, full_path))
-        abs_file_path = os.path.abspath(file_path)
-        if abs_file_path.startswith(abs_frontend_root) and os.path.exists(abs_file_path) and os.path.isfile(abs_file_path):
-            return FileResponse(abs_file_path)
-        # Serve index.html for SPA routing
-        return FileResponse(os.path.join(FRONTEND_BUILD_PATH, "index.html"))
+# Serve frontend for all non-API routes (must be last). SPAStaticFiles
+# serves the small build files from memory with a content ETag (304 on a
+# matching If-None-Match) and leaves only the large ones to StaticFiles.
+if FRONTEND_BUILD_PATH.exists():
+    app.mount("/", SPAStaticFiles(directory=FRONTEND_BUILD_PATH, html=True), name="spa")
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop and httptools when uvicorn[standard] installed them
+    # (not on Windows or PyPy). A single worker is used on purpose: response
+    # caches and the SSE audit stream live in-process.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
 
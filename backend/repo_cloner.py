@@ -1,15 +1,47 @@
 """Repository cloning functionality."""
+import concurrent.futures
 import subprocess
 import tempfile
 import shutil
 import os
 import logging
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 import re
+import secrets
+import string
 
 logger = logging.getLogger(__name__)
 
+# Cone-mode sparse-checkout patterns for .github/workflows, exactly as
+# `git sparse-checkout set .github/workflows` would write them (top-level
+# files plus that directory). Writing them directly saves two git processes.
+_WORKFLOWS_SPARSE_PATTERNS = "/*\n!/*/\n/.github/\n!/.github/*/\n/.github/workflows/\n"
+
+# Where clones go when no base directory is given
+_DEFAULT_BASE_DIR = Path(tempfile.gettempdir()) / "actsense-clones"
+
+# File suffixes GitHub Actions loads workflows from
+_WORKFLOW_SUFFIXES = (".yml", ".yaml")
+
+# Input validation patterns, compiled once
+_REPO_SLUG_RE = re.compile(r"[A-Za-z0-9_.-]{1,100}")
+_BRANCH_NAME_RE = re.compile(r"[A-Za-z0-9._/\-]{1,200}")
+# Every accepted token is made of [A-Za-z0-9_-]; translating with this table
+# leaves exactly the other characters behind.
+_TOKEN_CHAR_DELETIONS = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+# Any such token of this length is accepted...
+_MIN_TOKEN_LENGTH = 20
+_MAX_TOKEN_LENGTH = 100
+# ...and so is a longer fine-grained token (github_pat_ plus at least 20 chars)
+_FINE_GRAINED_TOKEN_PREFIX = "github_pat_"
+
+# Deletes clones after cleanup has renamed them out of the way; its threads
+# are joined at interpreter exit, so pending deletions still finish.
+_removal_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="clone-cleanup"
+)
+
 
 class CloneError(Exception):
     """User-facing git clone failure (map to HTTP 400, not 500)."""
@@ -50,12 +82,10 @@ class RepoCloner:
 
     def __init__(self, base_dir: Optional[str] = None):
         """Initialize with optional base directory for clones."""
-        if base_dir:
-            self.base_dir = Path(base_dir)
-            self.base_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            self.base_dir = Path(tempfile.gettempdir()) / "actsense-clones"
-            self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.base_dir = Path(base_dir) if base_dir else _DEFAULT_BASE_DIR
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Resolved once; clone directories are created directly under it
+        self._base_resolved = self.base_dir.resolve()
 
     def clone_repository(
         self,
@@ -76,7 +106,6 @@ class RepoCloner:
 
         # Credential-less URL; auth is supplied via git config environment (not argv).
         repo_url = f"https://github.com/{safe_owner}/{safe_repo}.git"
-        public_repo_url = repo_url  # alias used in sanitize step below
 
         # Explicit API token first, then GITHUB_TOKEN (e.g. container env) for private repos.
         raw = (token or "").strip() or (os.environ.get("GITHUB_TOKEN") or "").strip()
@@ -100,10 +129,13 @@ class RepoCloner:
             clone_env["GIT_CONFIG_VALUE_0"] = f"AUTHORIZATION: bearer {safe_token}"
 
         # Create unique directory for this clone (must stay under base_dir).
-        base_resolved = self.base_dir.resolve()
-        clone_dir = (self.base_dir / f"{safe_owner}_{safe_repo}_{os.getpid()}").resolve()
+        # Clones run on a thread pool, so the random suffix keeps two audits
+        # of the same repository from sharing (and cleaning up) one directory.
+        # The name is a single validated path component, so joining it onto
+        # the resolved base needs no further resolution.
+        clone_dir = self._base_resolved / f"{safe_owner}_{safe_repo}_{secrets.token_hex(8)}"
         try:
-            clone_dir.relative_to(base_resolved)
+            clone_dir.relative_to(self._base_resolved)
         except ValueError:
             raise ValueError("Invalid clone directory path") from None
         clone_dir_str = str(clone_dir)
@@ -111,13 +143,22 @@ class RepoCloner:
         try:
             # Clone with --no-checkout so no files are written yet.
             # --depth 1 + --filter=tree:0 skips all tree and blob objects
-            # until we explicitly ask for them via sparse-checkout.
+            # until we explicitly ask for them via sparse-checkout, and
+            # --no-tags keeps the tags pointing at the tip out of the fetch.
             # Use list args + -- separator + shell=False to avoid command injection sinks.
+            # Sparse checkout is enabled through -c so the clone's config has
+            # it from the start.
+            # Only stderr is kept (for error messages); --quiet keeps it to
+            # the errors themselves.
             clone_cmd = [
                 "git", "clone",
+                "--quiet",
                 "--depth", "1",
                 "--filter=tree:0",
+                "--no-tags",
                 "--no-checkout",
+                "-c", "core.sparseCheckout=true",
+                "-c", "core.sparseCheckoutCone=true",
             ]
             if safe_branch:
                 clone_cmd.extend(["-b", safe_branch])
@@ -125,7 +166,8 @@ class RepoCloner:
 
             result = subprocess.run(
                 clone_cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=60,
                 shell=False,
@@ -133,38 +175,25 @@ class RepoCloner:
             )
 
             if result.returncode != 0:
-                # Sanitize stderr before surfacing it — the URL may contain the token.
+                # The token only travels in the environment, but never let a
+                # copy of it in git's output reach the user.
                 sanitized_stderr = (
-                    result.stderr.replace(repo_url, public_repo_url) if safe_token else result.stderr
+                    result.stderr.replace(safe_token, "***") if safe_token else result.stderr
                 )
                 raise CloneError(
                     _clone_failure_user_message(sanitized_stderr, safe_token is not None)
                 ) from None
 
             # Configure sparse-checkout before any checkout happens.
-            subprocess.run(
-                ["git", "-C", clone_dir_str, "sparse-checkout", "init", "--cone"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                check=False,
-                shell=False,
-                env=clone_env,
-            )
-            subprocess.run(
-                ["git", "-C", clone_dir_str, "sparse-checkout", "set", ".github/workflows"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                check=False,
-                shell=False,
-                env=clone_env,
-            )
+            sparse_config = clone_dir / ".git" / "info" / "sparse-checkout"
+            sparse_config.parent.mkdir(parents=True, exist_ok=True)
+            sparse_config.write_text(_WORKFLOWS_SPARSE_PATTERNS)
 
             # Single checkout: only fetches blobs for .github/workflows.
             result = subprocess.run(
-                ["git", "-C", clone_dir_str, "checkout"],
-                capture_output=True,
+                ["git", "-C", clone_dir_str, "checkout", "--quiet"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=60,
                 shell=False,
@@ -178,8 +207,9 @@ class RepoCloner:
                 with open(sparse_config, 'w') as f:
                     f.write(".github/workflows/*\n")
                 subprocess.run(
-                    ["git", "-C", clone_dir_str, "checkout"],
-                    capture_output=True,
+                    ["git", "-C", clone_dir_str, "checkout", "--quiet"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     timeout=60,
                     shell=False,
@@ -213,7 +243,7 @@ class RepoCloner:
             raise ValueError(f"Invalid {field_name}")
         if "/" in value or value.startswith("-"):
             raise ValueError(f"Invalid {field_name}")
-        m = re.fullmatch(r"[A-Za-z0-9_.-]{1,100}", value)
+        m = _REPO_SLUG_RE.fullmatch(value)
         if not m:
             raise ValueError(f"Invalid {field_name}")
         return m.group(0)
@@ -227,7 +257,7 @@ class RepoCloner:
             raise ValueError("Invalid branch name")
         if "\\" in branch or " " in branch or "//" in branch or branch.endswith("/"):
             raise ValueError("Invalid branch name")
-        m = re.fullmatch(r"[A-Za-z0-9._/\-]{1,200}", branch)
+        m = _BRANCH_NAME_RE.fullmatch(branch)
         if not m:
             raise ValueError("Invalid branch name")
         return m.group(0)
@@ -235,47 +265,91 @@ class RepoCloner:
     @staticmethod
     def _validated_github_token(token: str) -> str:
         """Validate GitHub token format and return the token string."""
-        if not (re.fullmatch(r"^ghp_[A-Za-z0-9]{36}$", token) or
-                re.fullmatch(r"^github_pat_[A-Za-z0-9_\-]{20,}$", token) or
-                re.fullmatch(r"^[A-Za-z0-9_\-]{20,100}$", token)):
+        # A classic ghp_ token is 40 characters, so the length bounds cover
+        # it; only fine-grained tokens may run longer.
+        length = len(token)
+        if length < _MIN_TOKEN_LENGTH or (
+            length > _MAX_TOKEN_LENGTH and not token.startswith(_FINE_GRAINED_TOKEN_PREFIX)
+        ):
             raise ValueError("Invalid GitHub token format")
-        if any(c in token for c in "@:/\\ \n\r\t'\""):
+        if token.translate(_TOKEN_CHAR_DELETIONS):
             raise ValueError("Token contains forbidden characters")
         return token
 
     def get_file_content(self, clone_path: str, file_path: str) -> str:
         """Read file content from cloned repository."""
-        full_path = Path(clone_path) / file_path
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(full_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        # Open directly rather than checking existence first: one lookup, not two
+        try:
+            return RepoCloner._read_text(os.path.join(clone_path, file_path))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    def get_workflow_files(self, clone_path: str) -> list:
-        """Get all workflow files from cloned repository."""
-        workflows_dir = Path(clone_path) / ".github" / "workflows"
-        workflows = []
+    @staticmethod
+    def _read_text(path: str) -> str:
+        """Read a UTF-8 file with universal newlines.
 
-        if not workflows_dir.exists():
-            return workflows
+        Reading bytes and decoding once skips the text layer's incremental
+        decoder; newlines are then normalized as text mode would.
+        """
+        with open(path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
 
-        for file_path in workflows_dir.glob("*.yml"):
-            workflows.append({
-                "name": file_path.name,
-                "path": str(file_path.relative_to(clone_path))
-            })
+    @staticmethod
+    def _workflow_file_names(workflows_dir: str) -> List[str]:
+        """List the workflow file names in workflows_dir, sorted, in one scandir pass.
 
-        for file_path in workflows_dir.glob("*.yaml"):
-            workflows.append({
-                "name": file_path.name,
-                "path": str(file_path.relative_to(clone_path))
-            })
+        Symlinks are skipped: the dirent type then answers is_file without a
+        stat, and a cloned repository cannot point the reader outside itself.
+        """
+        try:
+            with os.scandir(workflows_dir) as entries:
+                return sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith(_WORKFLOW_SUFFIXES) and entry.is_file(follow_symlinks=False)
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
-        return workflows
+    def get_workflow_files(self, clone_path: str) -> list:
+        """Get all workflow files from cloned repository, sorted by name."""
+        names = RepoCloner._workflow_file_names(os.path.join(clone_path, ".github", "workflows"))
+        return [{"name": name, "path": f".github/workflows/{name}"} for name in names]
+
+    def read_workflow_files(self, clone_path: str) -> Dict[str, Union[str, Exception]]:
+        """Read every workflow file, keyed by its path relative to the clone.
+
+        Lets the caller remove the clone as soon as this returns. The files
+        are opened straight from the directory scan, joined onto a directory
+        path computed once. A file that cannot be read as UTF-8 maps to the
+        exception raised while reading it, so the caller can report it as it
+        would a failed read from the clone.
+        """
+        workflows_dir = os.path.join(clone_path, ".github", "workflows")
+        contents: Dict[str, Union[str, Exception]] = {}
+        for name in RepoCloner._workflow_file_names(workflows_dir):
+            path = f".github/workflows/{name}"
+            try:
+                contents[path] = RepoCloner._read_text(os.path.join(workflows_dir, name))
+            except (OSError, UnicodeDecodeError) as e:
+                contents[path] = e
+        return contents
 
     def cleanup(self, clone_path: str):
-        """Remove cloned repository directory."""
+        """Remove cloned repository directory.
+
+        The directory is renamed aside (one syscall) and deleted on a
+        background thread, so the caller does not wait for the unlinks.
+        """
         path = Path(clone_path)
-        if path.exists():
+        trash = path.with_name(f".trash-{secrets.token_hex(8)}")
+        try:
+            os.replace(path, trash)
+        except FileNotFoundError:
+            return
+        except OSError:
             shutil.rmtree(path, ignore_errors=True)
+            return
+        _removal_executor.submit(shutil.rmtree, trash, ignore_errors=True)
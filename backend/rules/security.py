@@ -7,6 +7,8 @@ import tempfile
 import json
 import os
 import base64
+import hashlib
+from collections import OrderedDict
 from github_client import GitHubClient
 from fastapi import HTTPException
 import sys
@@ -4034,6 +4036,35 @@ def check_audit_logging(workflow: Dict[str, Any]) -> List[Dict[str, Any]]:
     return issues
 
 
+# Dockerfile and JS bundle scans. Bundles are often MB-sized single lines, so
+# the cheap checksum search runs first and the download search, which
+# backtracks from every keyword hit, only runs when it can change the result.
+_DOCKERFILE_PIP_UNPINNED_RE = re.compile(r'pip\s+install\s+(?!.*==)', re.IGNORECASE)
+_DOCKERFILE_DOWNLOAD_RE = re.compile(r'(?:wget|curl)\s+.*?http', re.IGNORECASE)
+_DOCKERFILE_CHECKSUM_RE = re.compile(r'sha256|sha512|md5|checksum', re.IGNORECASE)
+_JS_DOWNLOAD_RE = re.compile(r'(?:wget|curl|fetch|download).*?http', re.IGNORECASE)
+_JS_CHECKSUM_RE = re.compile(r'sha256|sha512|md5|checksum|verify', re.IGNORECASE)
+
+# JS bundle scan results keyed by the bundle's SHA-256. Many action versions
+# ship a byte-identical dist/index.js, so each distinct bundle is scanned once.
+JS_SCAN_CACHE_SIZE = 1024
+_js_scan_results: "OrderedDict[bytes, bool]" = OrderedDict()
+
+
+def _js_downloads_without_checksum(action_content: str) -> bool:
+    """Whether a JS bundle downloads over HTTP without any checksum verification."""
+    digest = hashlib.sha256(action_content.encode("utf-8", "surrogatepass")).digest()
+    found = _js_scan_results.get(digest)
+    if found is not None:
+        _js_scan_results.move_to_end(digest)
+        return found
+    found = not _JS_CHECKSUM_RE.search(action_content) and _JS_DOWNLOAD_RE.search(action_content) is not None
+    _js_scan_results[digest] = found
+    if len(_js_scan_results) > JS_SCAN_CACHE_SIZE:
+        _js_scan_results.popitem(last=False)
+    return found
+
+
 def check_unpinnable_docker_action(action_yml: Dict[str, Any], action_ref: str, dockerfile_content: Optional[str] = None) -> List[Dict[str, Any]]:
     """Check for unpinnable Docker actions (using mutable tags instead of digests)."""
     issues = []
@@ -4071,7 +4102,7 @@ def check_unpinnable_docker_action(action_yml: Dict[str, Any], action_ref: str,
             content_to_check = dockerfile_content or ""
 
             # Check for unpinned Python packages
-            if re.search(r'pip\s+install\s+(?!.*==)', content_to_check, re.IGNORECASE):
+            if _DOCKERFILE_PIP_UNPINNED_RE.search(content_to_check):
                 issues.append({
                     "type": "unpinned_dockerfile_dependencies",
                     "severity": "high",
@@ -4085,7 +4116,7 @@ def check_unpinnable_docker_action(action_yml: Dict[str, Any], action_ref: str,
                 })
 
             # Check for unpinned external resources
-            if re.search(r'(wget|curl)\s+.*http', content_to_check, re.IGNORECASE) and not re.search(r'(sha256|sha512|md5|checksum)', content_to_check, re.IGNORECASE):
+            if not _DOCKERFILE_CHECKSUM_RE.search(content_to_check) and _DOCKERFILE_DOWNLOAD_RE.search(content_to_check):
                 issues.append({
                     "type": "unpinned_dockerfile_resources",
                     "severity": "high",
@@ -4198,7 +4229,7 @@ def check_unpinnable_javascript_action(action_yml: Dict[str, Any], action_ref: s
         # Check action code if available
         if action_content:
             # Check for downloading external resources without checksums
-            if re.search(r'(wget|curl|fetch|download).*http', action_content, re.IGNORECASE) and not re.search(r'(sha256|sha512|md5|checksum|verify)', action_content, re.IGNORECASE):
+            if _js_downloads_without_checksum(action_content):
                 issues.append({
                     "type": "unpinned_javascript_resources",
                     "severity": "high",
@@ -1,10 +1,14 @@
 """Security issue detection for GitHub Actions."""
+import asyncio
 from typing import List, Dict, Any, Optional, Callable
 from github_client import GitHubClient
 
 # Import rules from rules module
 from rules import security as security_rules
 
+# Runtimes checked by the JavaScript unpinnable-action rule
+_JAVASCRIPT_RUNTIMES = frozenset({"node12", "node16", "node20"})
+
 
 class SecurityAuditor:
     @staticmethod
@@ -302,10 +306,18 @@ class SecurityAuditor:
                                 "action": action_ref
                             })
             
-            # Check for unpinnable actions (Palo Alto Networks research)
-            issues.extend(security_rules.check_unpinnable_docker_action(action_yml, action_ref, dockerfile_content))
-            issues.extend(security_rules.check_unpinnable_composite_action(action_yml, action_ref))
-            issues.extend(security_rules.check_unpinnable_javascript_action(action_yml, action_ref, action_content))
+            # Check for unpinnable actions (Palo Alto Networks research),
+            # running only the rule for this action's runtime
+            runs = action_yml.get("runs", {})
+            using = runs.get("using") if isinstance(runs, dict) else None
+            if not isinstance(using, str):
+                using = None
+            if using == "docker":
+                issues.extend(security_rules.check_unpinnable_docker_action(action_yml, action_ref, dockerfile_content))
+            elif using == "composite":
+                issues.extend(security_rules.check_unpinnable_composite_action(action_yml, action_ref))
+            elif using in _JAVASCRIPT_RUNTIMES:
+                issues.extend(security_rules.check_unpinnable_javascript_action(action_yml, action_ref, action_content))
         
         return issues
 
@@ -354,27 +366,39 @@ class SecurityAuditor:
         # adversarial or hand-broken workflow files.
         workflow = SecurityAuditor._normalize_workflow(workflow)
 
-        # Check permissions
-        _log("  Checking permissions & tokens")
-        perm_issues = SecurityAuditor.check_permissions(workflow)
-        if content and perm_issues:
-            for issue in perm_issues:
-                line_num = security_rules._find_line_number(content, "permissions")
-                if line_num:
-                    issue["line_number"] = line_num
-        issues.extend(perm_issues)
+        # The secrets check shells out to TruffleHog (up to 30s); run it on a
+        # thread, started now so it overlaps the permission checks below.
+        secrets_task = asyncio.ensure_future(
+            asyncio.to_thread(SecurityAuditor.check_secrets_in_workflow, workflow, content)
+        )
+
+        try:
+            # Check permissions
+            _log("  Checking permissions & tokens")
+            perm_issues = SecurityAuditor.check_permissions(workflow)
+            if content and perm_issues:
+                for issue in perm_issues:
+                    line_num = security_rules._find_line_number(content, "permissions")
+                    if line_num:
+                        issue["line_number"] = line_num
+            issues.extend(perm_issues)
         
-        # Check GITHUB_TOKEN permissions
-        token_issues = SecurityAuditor.check_github_token_permissions(workflow)
-        if content and token_issues:
-            for issue in token_issues:
-                line_num = security_rules._find_line_number(content, "permissions", issue.get("message", ""))
-                if line_num:
-                    issue["line_number"] = line_num
-        issues.extend(token_issues)
+            # Check GITHUB_TOKEN permissions
+            token_issues = SecurityAuditor.check_github_token_permissions(workflow)
+            if content and token_issues:
+                for issue in token_issues:
+                    line_num = security_rules._find_line_number(content, "permissions", issue.get("message", ""))
+                    if line_num:
+                        issue["line_number"] = line_num
+            issues.extend(token_issues)
+        except BaseException:
+            # The thread cannot be interrupted, but nothing is left awaiting
+            # it and its outcome is not reported as never retrieved.
+            secrets_task.cancel()
+            raise
         
         _log("  Checking secrets & credentials")
-        secret_issues = SecurityAuditor.check_secrets_in_workflow(workflow, content)
+        secret_issues = await secrets_task
         if content and secret_issues:
             for issue in secret_issues:
                 # Try to find the secret pattern in content
@@ -1,8 +1,28 @@
 """Pytest configuration and fixtures."""
+import os
+import shutil
+import tempfile
 import pytest
 from typing import Dict, Any
 
 
+def pytest_configure(config):
+    """Point the backend's on-disk stores at a throwaway directory.
+
+    main creates its caches and storage at import time, during collection,
+    so the directory has to be in place before any test module is imported.
+    """
+    config._actsense_data_dir = tempfile.mkdtemp(prefix="actsense-test-data-")
+    os.environ["ACTSENSE_DATA_DIR"] = config._actsense_data_dir
+
+
+def pytest_unconfigure(config):
+    """Remove the directory created in pytest_configure."""
+    data_dir = getattr(config, "_actsense_data_dir", None)
+    if data_dir:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
 @pytest.fixture
 def sample_workflow() -> Dict[str, Any]:
     """Basic workflow structure for testing."""
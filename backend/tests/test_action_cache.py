@@ -0,0 +1,91 @@
+"""Tests for action_cache.py"""
+import datetime
+import os
+import sqlite3
+import tempfile
+import workflow_parser
+from action_cache import ParsedActionCache
+from workflow_parser import WorkflowParser
+
+
+class TestParsedActionCache:
+    """Test ParsedActionCache class."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a parsed document by content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ParsedActionCache(db_path=os.path.join(tmpdir, "cache.sqlite3"))
+            assert cache.get("name: A") is None
+
+            cache.set("name: A", {"name": "A", "runs": {"using": "node20"}})
+            assert cache.get("name: A") == {"name": "A", "runs": {"using": "node20"}}
+            assert cache.get("name: B") is None
+            cache.close()
+
+    def test_non_json_documents_are_not_stored(self):
+        """Test that documents that would not round-trip through JSON are skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ParsedActionCache(db_path=os.path.join(tmpdir, "cache.sqlite3"))
+            cache.set("date: 2024-01-01", {"date": datetime.date(2024, 1, 1)})
+            cache.set("1: a", {1: "a"})
+
+            assert cache.get("date: 2024-01-01") is None
+            assert cache.get("1: a") is None
+            cache.close()
+
+    def test_writes_land_on_writer_thread(self):
+        """Test that set queues the row and flush stores it with relaxed syncing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "cache.sqlite3")
+            cache = ParsedActionCache(db_path=db_path)
+            assert cache._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+            cache.set("name: A", {"name": "A"})
+            assert cache.get("name: A") == {"name": "A"}
+            cache.flush()
+            assert cache._pending == {}
+
+            reader = sqlite3.connect(db_path)
+            assert reader.execute("SELECT COUNT(*) FROM parsed_actions").fetchone()[0] == 1
+            reader.close()
+            cache.close()
+
+    def test_default_path_in_data_dir(self, tmp_path, monkeypatch):
+        """Test that the default database location follows ACTSENSE_DATA_DIR."""
+        monkeypatch.setenv("ACTSENSE_DATA_DIR", str(tmp_path))
+        cache = ParsedActionCache()
+        assert cache.db_path == tmp_path / "action_cache.sqlite3"
+        assert cache.db_path.exists()
+        cache.close()
+
+    def test_persists_across_instances(self):
+        """Test that parsed documents survive reopening the database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "cache.sqlite3")
+            cache = ParsedActionCache(db_path=db_path)
+            cache.set("name: A", {"name": "A"})
+            cache.close()
+
+            reopened = ParsedActionCache(db_path=db_path)
+            assert reopened.get("name: A") == {"name": "A"}
+            reopened.close()
+
+    def test_parser_uses_store_behind_lru(self, monkeypatch):
+        """Test that WorkflowParser serves a stored parse without parsing again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ParsedActionCache(db_path=os.path.join(tmpdir, "cache.sqlite3"))
+            content = "name: 'Stored Action'\nruns:\n  using: 'composite'\n"
+            try:
+                WorkflowParser.set_action_store(cache)
+                assert WorkflowParser.parse_action_yml(content)["name"] == "Stored Action"
+
+                def fail(_content):
+                    raise AssertionError("content should have been served from the store")
+
+                # Drop the in-process LRU so the lookup reaches the store
+                monkeypatch.setattr(workflow_parser, "_safe_load_workflow_yaml", fail)
+                workflow_parser._parse_action_yml_cached.cache_clear()
+                assert WorkflowParser.parse_action_yml(content)["name"] == "Stored Action"
+            finally:
+                WorkflowParser.set_action_store(None)
+                cache.close()
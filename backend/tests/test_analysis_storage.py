@@ -2,8 +2,10 @@
 import pytest
 import json
 import tempfile
+import threading
 import shutil
 from pathlib import Path
+import analysis_storage
 from analysis_storage import AnalysisStorage
 
 
@@ -17,11 +19,11 @@ class TestAnalysisStorage:
             assert storage.storage_dir == Path(tmpdir)
             assert storage.storage_dir.exists()
     
-    def test_init_with_default_dir(self):
-        """Test initialization with default storage directory."""
+    def test_init_with_default_dir(self, tmp_path, monkeypatch):
+        """Test initialization with the default storage directory under ACTSENSE_DATA_DIR."""
+        monkeypatch.setenv("ACTSENSE_DATA_DIR", str(tmp_path))
         storage = AnalysisStorage()
-        expected = Path(__file__).parent.parent.parent / "data" / "analyses"
-        assert storage.storage_dir == expected
+        assert storage.storage_dir == tmp_path / "analyses"
         assert storage.storage_dir.exists()
     
     def test_save_analysis(self):
@@ -54,9 +56,25 @@ class TestAnalysisStorage:
             assert data["repository"] == "test/repo"
             assert data["action"] is None
             assert data["method"] == "api"
-            assert data["graph"] == graph_data
             assert data["statistics"] == statistics
             assert "timestamp" in data
+            
+            # Graph is stored separately from the metadata
+            assert "graph" not in data
+            with open(storage.storage_dir / "graphs" / f"{analysis_id}.json", 'r') as f:
+                assert json.load(f)["graph"] == graph_data
+    
+    def test_save_analysis_compact_by_default(self, tmp_path, monkeypatch):
+        """Test that stored JSON is compact unless ACTSENSE_PRETTY_JSON=1."""
+        monkeypatch.delenv("ACTSENSE_PRETTY_JSON", raising=False)
+        storage = AnalysisStorage(storage_dir=str(tmp_path / "compact"))
+        analysis_id = storage.save_analysis("test/repo", None, {"nodes": []}, {"total_nodes": 0})
+        assert b"\n" not in (storage.storage_dir / f"{analysis_id}.json").read_bytes()
+        
+        monkeypatch.setenv("ACTSENSE_PRETTY_JSON", "1")
+        storage = AnalysisStorage(storage_dir=str(tmp_path / "pretty"))
+        analysis_id = storage.save_analysis("test/repo", None, {"nodes": []}, {"total_nodes": 0})
+        assert b"\n  " in (storage.storage_dir / f"{analysis_id}.json").read_bytes()
     
     def test_save_analysis_with_action(self):
         """Test saving an analysis with action."""
@@ -100,6 +118,111 @@ class TestAnalysisStorage:
             assert retrieved["id"] == analysis_id
             assert retrieved["repository"] == "test/repo"
             assert retrieved["graph"] == graph_data
+
+    def test_save_analysis_in_background(self):
+        """Test a background save is readable at once and lands on disk after flush."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            graph_data = {"nodes": [{"id": "a"}], "edges": []}
+
+            analysis_id = storage.save_analysis_in_background(
+                repository="test/repo",
+                action=None,
+                graph_data=graph_data,
+                statistics={"total_nodes": 1}
+            )
+
+            retrieved = storage.get_analysis(analysis_id)
+            assert retrieved["id"] == analysis_id
+            assert retrieved["graph"] == graph_data
+
+            storage.flush()
+            assert (storage.storage_dir / f"{analysis_id}.json").exists()
+            assert analysis_id not in storage._pending
+            assert storage.get_analysis(analysis_id)["graph"] == graph_data
+            assert storage.list_analyses()[0]["id"] == analysis_id
+
+    def test_list_analyses_includes_pending_background_saves(self):
+        """Test that listing before flush shows queued saves, newest first and filtered."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            stored_id = storage.save_analysis(
+                repository="test/repo", action=None, graph_data={}, statistics={}
+            )
+            # Hold the writer so the background saves stay pending
+            release = threading.Event()
+            storage._writer.submit(release.wait)
+            try:
+                first_id = storage.save_analysis_in_background(
+                    repository="test/repo", action=None, graph_data={}, statistics={}
+                )
+                other_id = storage.save_analysis_in_background(
+                    repository="other/repo", action=None, graph_data={}, statistics={}
+                )
+
+                listed = storage.list_analyses()
+                assert [a["id"] for a in listed] == [other_id, first_id, stored_id]
+                assert "graph" not in listed[0]
+                filtered = storage.list_analyses(repository="test/repo")
+                assert [a["id"] for a in filtered] == [first_id, stored_id]
+            finally:
+                release.set()
+            storage.flush()
+            assert [a["id"] for a in storage.list_analyses()] == [other_id, first_id, stored_id]
+
+    def test_delete_analysis_pending_background_save(self):
+        """Test deleting an analysis whose background save is still queued."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            analysis_id = storage.save_analysis_in_background(
+                repository="test/repo",
+                action=None,
+                graph_data={"nodes": []},
+                statistics={}
+            )
+
+            assert storage.delete_analysis(analysis_id) is True
+            assert storage.get_analysis(analysis_id) is None
+            assert storage.list_analyses() == []
+
+    def test_get_analysis_large_file_memory_mapped(self):
+        """Test retrieving an analysis larger than the mmap threshold."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            graph_data = {"nodes": [{"id": f"node-{i}", "label": "x" * 64} for i in range(20000)]}
+            
+            analysis_id = storage.save_analysis(
+                repository="test/repo",
+                action=None,
+                graph_data=graph_data,
+                statistics={"total_nodes": 20000}
+            )
+            
+            file_path = Path(tmpdir) / "graphs" / f"{analysis_id}.json"
+            assert file_path.stat().st_size > analysis_storage.MMAP_THRESHOLD
+            
+            retrieved = storage.get_analysis(analysis_id)
+            assert retrieved["graph"] == graph_data
+    
+    def test_get_analysis_legacy_inline_graph(self):
+        """Test retrieving an analysis saved with the graph inline."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graph_data = {"nodes": [{"id": "node1"}], "edges": []}
+            with open(Path(tmpdir) / "legacy-id.json", 'w') as f:
+                json.dump({
+                    "id": "legacy-id",
+                    "timestamp": "2024-01-01T00:00:00+00:00",
+                    "repository": "test/repo",
+                    "action": None,
+                    "method": "api",
+                    "graph": graph_data,
+                    "statistics": {"total_nodes": 1}
+                }, f)
+            
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            retrieved = storage.get_analysis("legacy-id")
+            assert retrieved["graph"] == graph_data
+            assert storage.list_analyses()[0]["id"] == "legacy-id"
     
     def test_get_analysis_nonexistent(self):
         """Test retrieving a non-existent analysis."""
@@ -227,9 +350,13 @@ class TestAnalysisStorage:
             file_path = storage.storage_dir / f"{analysis_id}.json"
             assert file_path.exists()
             
+            graph_path = storage.storage_dir / "graphs" / f"{analysis_id}.json"
+            assert graph_path.exists()
+            
             result = storage.delete_analysis(analysis_id)
             assert result is True
             assert not file_path.exists()
+            assert not graph_path.exists()
     
     def test_delete_analysis_nonexistent(self):
         """Test deleting a non-existent analysis."""
@@ -238,3 +365,48 @@ class TestAnalysisStorage:
             result = storage.delete_analysis("nonexistent-id")
             assert result is False
 
+    def test_index_survives_reopen(self):
+        """Test that a new storage instance lists analyses from the persisted index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            first = storage.save_analysis(
+                repository="test/repo1",
+                action=None,
+                graph_data={"nodes": []},
+                statistics={"total_nodes": 0}
+            )
+            second = storage.save_analysis(
+                repository="test/repo2",
+                action=None,
+                graph_data={"nodes": []},
+                statistics={"total_nodes": 0}
+            )
+            storage.delete_analysis(first)
+            
+            reopened = AnalysisStorage(storage_dir=tmpdir)
+            analyses = reopened.list_analyses()
+            assert [a["id"] for a in analyses] == [second]
+            
+            # Opening compacts the log down to live entries only
+            index_lines = (Path(tmpdir) / "_index.jsonl").read_text().splitlines()
+            assert len(index_lines) == 1
+    
+    def test_index_rebuilt_from_analysis_files(self):
+        """Test that a missing index is rebuilt from existing analysis files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i, timestamp in enumerate(["2024-01-01T00:00:00+00:00", "2024-02-01T00:00:00+00:00"]):
+                with open(Path(tmpdir) / f"id-{i}.json", 'w') as f:
+                    json.dump({
+                        "id": f"id-{i}",
+                        "timestamp": timestamp,
+                        "repository": "test/repo",
+                        "action": None,
+                        "method": "api",
+                        "graph": {"nodes": []},
+                        "statistics": {"total_nodes": 0}
+                    }, f)
+            
+            storage = AnalysisStorage(storage_dir=tmpdir)
+            analyses = storage.list_analyses()
+            assert [a["id"] for a in analyses] == ["id-1", "id-0"]
+            assert (Path(tmpdir) / "_index.jsonl").exists()
@@ -0,0 +1,91 @@
+"""Tests for commit_cache.py"""
+import os
+import tempfile
+import pytest
+import httpx
+from github_client import GitHubClient
+from commit_cache import CommitMetadataCache
+
+FULL_SHA = "a" * 40
+
+
+class TestCommitMetadataCache:
+    """Test CommitMetadataCache class."""
+    
+    def test_is_immutable_ref(self):
+        """Test that only full commit SHAs are treated as immutable."""
+        assert CommitMetadataCache.is_immutable_ref(FULL_SHA)
+        assert not CommitMetadataCache.is_immutable_ref("main")
+        assert not CommitMetadataCache.is_immutable_ref("v4")
+        assert not CommitMetadataCache.is_immutable_ref("a" * 7)
+        assert not CommitMetadataCache.is_immutable_ref(None)
+    
+    def test_set_and_get_commit_date(self):
+        """Test storing and retrieving a commit date."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CommitMetadataCache(db_path=os.path.join(tmpdir, "cache.sqlite3"))
+            assert cache.get_commit_date("owner", "repo", FULL_SHA) is None
+            
+            cache.set_commit_date("owner", "repo", FULL_SHA, "2024-01-01T00:00:00Z")
+            assert cache.get_commit_date("owner", "repo", FULL_SHA) == "2024-01-01T00:00:00Z"
+            assert cache.get_commit_date("owner", "other", FULL_SHA) is None
+            cache.close()
+    
+    def test_default_path_in_data_dir(self, tmp_path, monkeypatch):
+        """Test that the default database location follows ACTSENSE_DATA_DIR."""
+        monkeypatch.setenv("ACTSENSE_DATA_DIR", str(tmp_path))
+        cache = CommitMetadataCache()
+        assert cache.db_path == tmp_path / "commit_cache.sqlite3"
+        assert cache.db_path.exists()
+        cache.close()
+    
+    def test_persists_across_instances(self):
+        """Test that cached dates survive reopening the database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "cache.sqlite3")
+            cache = CommitMetadataCache(db_path=db_path)
+            cache.set_commit_date("owner", "repo", FULL_SHA, "2024-01-01T00:00:00Z")
+            cache.close()
+            
+            reopened = CommitMetadataCache(db_path=db_path)
+            assert reopened.get_commit_date("owner", "repo", FULL_SHA) == "2024-01-01T00:00:00Z"
+            reopened.close()
+
+
+class TestGitHubClientCommitCache:
+    """Test GitHubClient integration with CommitMetadataCache."""
+    
+    @pytest.mark.asyncio
+    async def test_get_commit_date_uses_cache_for_full_sha(self):
+        """Test that a full SHA is fetched once and then served from the cache."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"commit": {"author": {"date": "2024-01-01T00:00:00Z"}}})
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CommitMetadataCache(db_path=os.path.join(tmpdir, "cache.sqlite3"))
+            for _ in range(2):
+                client = GitHubClient(commit_cache=cache)
+                client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                assert await client.get_commit_date("owner", "repo", FULL_SHA) == "2024-01-01T00:00:00Z"
+                await client.aclose()
+            cache.close()
+        
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_commit_date_skips_cache_for_mutable_ref(self):
+        """Test that branch names are never cached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CommitMetadataCache(db_path=os.path.join(tmpdir, "cache.sqlite3"))
+            client = GitHubClient(commit_cache=cache)
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"commit": {"author": {"date": "2024-01-01T00:00:00Z"}}})
+            ))
+            await client.get_commit_date("owner", "repo", "main")
+            await client.aclose()
+            
+            assert cache.get_commit_date("owner", "repo", "main") is None
+            cache.close()
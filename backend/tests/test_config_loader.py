@@ -195,6 +195,41 @@ class TestConfigLoader:
         finally:
             os.unlink(config_path)
     
+    def test_load_trusted_publishers_cached(self, monkeypatch):
+        """Test that an unchanged config file is not re-parsed."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({"trusted_publishers": ["actions/"]}, f)
+            config_path = f.name
+        
+        try:
+            loader = ConfigLoader(config_path=config_path)
+            assert loader.load_trusted_publishers() == ["actions/"]
+            
+            def fail_load(*args, **kwargs):
+                raise AssertionError("config should be served from cache")
+            
+            monkeypatch.setattr(yaml, "load", fail_load)
+            assert loader.load_trusted_publishers() == ["actions/"]
+        finally:
+            os.unlink(config_path)
+    
+    def test_load_trusted_publishers_reloads_on_change(self):
+        """Test that the cache is invalidated when the file changes."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({"trusted_publishers": ["actions/"]}, f)
+            config_path = f.name
+        
+        try:
+            loader = ConfigLoader(config_path=config_path)
+            assert loader.load_trusted_publishers() == ["actions/"]
+            
+            with open(config_path, 'w') as f:
+                yaml.dump({"trusted_publishers": ["actions/", "github/"]}, f)
+            
+            assert loader.load_trusted_publishers() == ["actions/", "github/"]
+        finally:
+            os.unlink(config_path)
+    
     def test_get_default_trusted_publishers(self):
         """Test getting default trusted publishers."""
         loader = ConfigLoader(config_path="/nonexistent/path.yaml")
@@ -1,8 +1,11 @@
 """Tests for github_client.py"""
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
 import httpx
+import github_client
 from github_client import GitHubClient
 
 
@@ -26,7 +29,7 @@ class TestGitHubClient:
         """Test getting repository contents successfully."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"name": "file.txt", "type": "file"}
+        mock_response.content = b'{"name": "file.txt", "type": "file"}'
         
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
@@ -40,6 +43,221 @@ class TestGitHubClient:
             
             assert result == {"name": "file.txt", "type": "file"}
     
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_requests(self):
+        """Test that one pooled AsyncClient serves every request and is closed by aclose."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"name": "file.txt", "type": "file"}'
+        
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get.return_value = mock_response
+            mock_client_class.return_value = mock_client
+            
+            client = GitHubClient()
+            await client.get_repo_contents("owner", "repo", "a")
+            await client.get_repo_contents("owner", "repo", "b")
+            await client.aclose()
+            
+            assert mock_client_class.call_count == 1
+            assert mock_client.get.call_count == 2
+            mock_client.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_conditional_request_replays_cached_body(self, monkeypatch):
+        """Test that a 304 for a known ETag returns the previously fetched body."""
+        # Treat every cached entry as stale so the second call revalidates
+        monkeypatch.setattr(github_client, "RESPONSE_TTL", 0)
+        seen_etags = []
+        
+        def handler(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"abc"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"name": "file.txt"}, headers={"ETag": '"abc"'})
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        first = await client.get_repo_contents("owner", "repo", "file.txt")
+        second = await client.get_repo_contents("owner", "repo", "file.txt")
+        await client.aclose()
+        
+        assert first == second == {"name": "file.txt"}
+        assert seen_etags == [None, '"abc"']
+    
+    @pytest.mark.asyncio
+    async def test_fresh_responses_served_from_cache(self):
+        """Test that 200 and 404 responses are reused within the TTL without a request."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path.endswith("missing.yml"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"name": "file.txt"})
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        for _ in range(2):
+            assert await client.get_repo_contents("owner", "repo", "file.txt") == {"name": "file.txt"}
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_repo_contents("owner", "repo", "missing.yml")
+        await client.aclose()
+        
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_shared_http_client_sends_auth_and_stays_open(self):
+        """Test that a caller-provided pool gets per-request auth and is not closed."""
+        seen_auth = []
+        
+        def handler(request):
+            seen_auth.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json={"name": "file.txt"})
+        
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = GitHubClient(token="test_token", http_client=shared)
+        
+        await client.get_repo_contents("owner", "repo", "file.txt")
+        await client.aclose()
+        
+        assert seen_auth == ["token test_token"]
+        assert not shared.is_closed
+        await shared.aclose()
+
+    @pytest.mark.asyncio
+    async def test_shared_response_cache_is_scoped_by_token(self):
+        """Test that clients sharing a cache reuse responses only for the same token."""
+        seen_auth = []
+
+        def handler(request):
+            seen_auth.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json={"name": "file.txt"})
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache = github_client.OrderedDict()
+        for token in ("a", "a", "b", None):
+            client = GitHubClient(token=token, http_client=shared, response_cache=cache)
+            await client.get_repo_contents("owner", "repo", "file.txt")
+        await shared.aclose()
+
+        assert seen_auth == ["token a", "token b", None]
+        assert len(cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_secondary_rate_limit_is_retried(self, monkeypatch):
+        """Test that 429 and 403-with-Retry-After responses are retried after waiting."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(github_client.asyncio, "sleep", fake_sleep)
+        responses = [
+            httpx.Response(403, headers={"Retry-After": "7"}),
+            httpx.Response(429),
+            httpx.Response(200, json={"name": "file.txt"}),
+        ]
+
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+        assert await client.get_repo_contents("owner", "repo", "file.txt") == {"name": "file.txt"}
+        await client.aclose()
+
+        assert delays == [7.0, github_client.RETRY_BASE_DELAY * 2]
+
+    @pytest.mark.asyncio
+    async def test_primary_rate_limit_is_not_retried(self):
+        """Test that a 403 without Retry-After is returned without retrying."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(403, headers={"X-RateLimit-Remaining": "0"})
+
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(HTTPException):
+            await client.get_repo_contents("owner", "repo", "file.txt")
+        await client.aclose()
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_capped(self):
+        """Test that no more than MAX_CONCURRENT_REQUESTS requests run at once."""
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        await asyncio.gather(*[
+            client.get_repo_contents("owner", "repo", f"file{i}") for i in range(25)
+        ])
+        await client.aclose()
+        
+        assert max_in_flight == github_client.MAX_CONCURRENT_REQUESTS
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_are_coalesced(self):
+        """Test that concurrent GETs of the same URL share one HTTP request."""
+        calls = []
+        
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"name": "action.yml"})
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        results = await asyncio.gather(*[
+            client.get_repo_contents("owner", "repo", "action.yml") for _ in range(5)
+        ])
+        await client.aclose()
+        
+        assert all(r == {"name": "action.yml"} for r in results)
+        assert len(calls) == 1
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_inflight_coalesces_across_clients_per_token(self):
+        """Test that clients sharing an in-flight map share requests only within one token."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.headers.get("Authorization"))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"name": "repo"})
+
+        pool = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        inflight = {}
+        clients = [
+            GitHubClient(token=token, http_client=pool, inflight=inflight)
+            for token in (None, None, "a" * 40)
+        ]
+        await asyncio.gather(*[
+            client.get_repo_contents("owner", "repo", "action.yml") for client in clients
+        ])
+        await pool.aclose()
+
+        assert sorted(calls, key=str) == sorted([None, "token " + "a" * 40], key=str)
+        assert inflight == {}
+
     @pytest.mark.asyncio
     async def test_get_repo_contents_rate_limit(self):
         """Test handling rate limit error."""
@@ -69,7 +287,8 @@ class TestGitHubClient:
             "content": "SGVsbG8gV29ybGQ="  # "Hello World" in base64
         }
         
-        with patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
+        with patch.object(GitHubClient, "get_file_content_raw", new_callable=AsyncMock, return_value=None), \
+                patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_contents
             
             client = GitHubClient()
@@ -80,7 +299,8 @@ class TestGitHubClient:
     @pytest.mark.asyncio
     async def test_get_file_content_directory(self):
         """Test getting file content when path is directory."""
-        with patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
+        with patch.object(GitHubClient, "get_file_content_raw", new_callable=AsyncMock, return_value=None), \
+                patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = [{"name": "file1.txt"}, {"name": "file2.txt"}]
             
             client = GitHubClient()
@@ -94,7 +314,8 @@ class TestGitHubClient:
             "content": "plain text"
         }
         
-        with patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
+        with patch.object(GitHubClient, "get_file_content_raw", new_callable=AsyncMock, return_value=None), \
+                patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_contents
             
             client = GitHubClient()
@@ -102,6 +323,94 @@ class TestGitHubClient:
             
             assert content == "plain text"
     
+    @pytest.mark.asyncio
+    async def test_get_file_content_prefers_raw_host(self):
+        """Test that file content comes from the raw host without the contents API."""
+        requested = []
+        
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, text="name: CI\n")
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        content = await client.get_file_content("owner", "repo", ".github/workflows/ci.yml")
+        await client.aclose()
+        
+        assert content == "name: CI\n"
+        assert requested == ["https://raw.githubusercontent.com/owner/repo/HEAD/.github/workflows/ci.yml"]
+    
+    @pytest.mark.asyncio
+    async def test_get_file_content_falls_back_to_contents_api(self):
+        """Test that a raw-host miss falls back to the base64 contents API."""
+        def handler(request):
+            if request.url.host == "raw.githubusercontent.com":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"encoding": "base64", "content": "SGVsbG8gV29ybGQ="})
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        content = await client.get_file_content("owner", "repo", "file.txt")
+        await client.aclose()
+        
+        assert content == "Hello World"
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_action_metadata_batches_lookups(self):
+        """Test that action.yml for several actions is fetched with one GraphQL query."""
+        requests = []
+        
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            body = json.loads(request.content)
+            variables = body["variables"]
+            assert variables["y1"] == "HEAD:sub/action.yml"
+            return httpx.Response(200, json={"data": {
+                "r0": {
+                    "name": "a", "nameWithOwner": "owner/a", "isPrivate": False, "isArchived": True,
+                    "defaultBranchRef": {"name": "main"}, "yml": {"text": "name: A"}, "yaml": None
+                },
+                "r1": {"yml": None, "yaml": {"text": "name: B"}, "dockerfile": {"text": "FROM alpine"}},
+                "r2": None
+            }})
+        
+        client = GitHubClient(token="test_token")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        await client.prefetch_action_metadata([
+            ("owner", "a", None), ("owner", "b", "sub/"), ("owner", "missing", None)
+        ])
+        a = await client.get_action_metadata("owner", "a", "v1")
+        b = await client.get_action_metadata("owner", "b", "v1", "sub")
+        dockerfile = await client.get_file_content("owner", "b", "sub/Dockerfile")
+        repo_info = await client.get_repository_info("owner", "a")
+        await client.aclose()
+        
+        assert requests == [("POST", "/graphql")]
+        assert repo_info == {
+            "name": "a", "full_name": "owner/a", "private": False, "archived": True, "default_branch": "main"
+        }
+        assert a == {"content": "name: A", "path": "action.yml"}
+        assert b == {"content": "name: B", "path": "sub/action.yaml"}
+        assert dockerfile == "FROM alpine"
+        assert ("owner", "missing", "") not in client._prefetched_metadata
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_action_metadata_requires_token(self):
+        """Test that prefetching is skipped without a token, since GraphQL needs auth."""
+        def handler(request):
+            raise AssertionError("no request expected")
+        
+        client = GitHubClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        await client.prefetch_action_metadata([("owner", "a", None)])
+        await client.aclose()
+        
+        assert client._prefetched_metadata == {}
+    
     @pytest.mark.asyncio
     async def test_get_workflows_success(self):
         """Test getting workflows successfully."""
@@ -119,7 +428,23 @@ class TestGitHubClient:
             
             assert len(workflows) == 2
             assert all(w["name"].endswith((".yml", ".yaml")) for w in workflows)
-    
+
+    @pytest.mark.asyncio
+    async def test_get_workflows_skips_directories(self):
+        """Test directory entries with a YAML-looking name are skipped."""
+        mock_workflows = [
+            {"name": "ci.yml", "type": "file"},
+            {"name": "templates.yml", "type": "dir"}
+        ]
+
+        with patch.object(GitHubClient, "get_repo_contents", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_workflows
+
+            client = GitHubClient()
+            workflows = await client.get_workflows("owner", "repo")
+
+            assert [w["name"] for w in workflows] == ["ci.yml"]
+
     @pytest.mark.asyncio
     async def test_get_workflows_not_found(self):
         """Test getting workflows when directory doesn't exist."""
@@ -203,6 +528,21 @@ class TestGitHubClient:
             
             assert result is None
     
+    @pytest.mark.asyncio
+    async def test_get_action_metadata_falls_back_to_yaml(self):
+        """Test that action.yaml is used when action.yml is missing."""
+        with patch.object(GitHubClient, "get_file_content", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = [
+                HTTPException(status_code=404, detail="Not found"),
+                "name: My Action",
+            ]
+            
+            client = GitHubClient()
+            result = await client.get_action_metadata("owner", "repo", "main")
+            
+            assert result == {"content": "name: My Action", "path": "action.yaml"}
+            assert mock_get.await_count == 2
+    
     @pytest.mark.asyncio
     async def test_get_latest_tag_from_releases(self):
         """Test getting latest tag from releases API."""
@@ -256,6 +596,32 @@ class TestGitHubClient:
             
             assert tag == "v2.0.0"
     
+    @pytest.mark.asyncio
+    async def test_get_latest_tag_orders_versions_semantically(self):
+        """Test that multi-digit and pre-release tags are ordered correctly."""
+        mock_tags = [
+            {"name": "latest"},
+            {"name": "v1.9.0"},
+            {"name": "v1.10.0-rc1"},
+            {"name": "v1.10.0"},
+            {"name": "v1.2.3.4"}
+        ]
+        
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_response_releases = MagicMock()
+            mock_response_releases.status_code = 404
+            mock_response_tags = MagicMock()
+            mock_response_tags.status_code = 200
+            mock_response_tags.json.return_value = mock_tags
+            mock_client.get.side_effect = [mock_response_releases, mock_response_tags]
+            mock_client_class.return_value = mock_client
+            
+            client = GitHubClient()
+            tag = await client.get_latest_tag("owner", "repo")
+            
+            assert tag == "v1.10.0"
+    
     @pytest.mark.asyncio
     async def test_get_latest_tag_no_tags(self):
         """Test getting latest tag when no tags exist."""
@@ -407,7 +773,28 @@ class TestGitHubClient:
             repo_info = await client.get_repository_info("owner", "repo")
             
             assert repo_info == mock_repo
-    
+
+    @pytest.mark.asyncio
+    async def test_get_repository_info_memoized_per_client(self):
+        """Test that repeated and concurrent lookups of one repository are decoded once."""
+        client = GitHubClient()
+        calls = []
+
+        async def fetch(owner, repo):
+            calls.append((owner, repo))
+            await asyncio.sleep(0)
+            return {"name": repo}
+
+        with patch.object(client, "_fetch_repository_info", side_effect=fetch):
+            first, second = await asyncio.gather(
+                client.get_repository_info("owner", "repo"),
+                client.get_repository_info("owner", "repo"),
+            )
+            third = await client.get_repository_info("owner", "repo")
+
+        assert first == second == third == {"name": "repo"}
+        assert calls == [("owner", "repo")]
+
     @pytest.mark.asyncio
     async def test_get_repository_info_not_found(self):
         """Test getting repository info when repo doesn't exist."""
@@ -493,6 +880,20 @@ class TestGitHubClient:
         assert ref == "v1.0.0"
         assert subdir == "subdir"
     
+    def test_parse_action_reference_nested_subdir_and_branch_ref(self):
+        """Test parsing a nested subdirectory with a branch ref containing slashes."""
+        client = GitHubClient()
+        owner, repo, ref, subdir = client.parse_action_reference("owner/repo/a/b@feature/x")
+        
+        assert (owner, repo, ref, subdir) == ("owner", "repo", "feature/x", "a/b")
+    
+    def test_parse_action_reference_multiple_at_signs(self):
+        """Test that the last '@' separates the ref."""
+        client = GitHubClient()
+        owner, repo, ref, subdir = client.parse_action_reference("owner/repo@a@b")
+        
+        assert (owner, repo, ref, subdir) == ("owner", "repo@a", "b", None)
+    
     def test_parse_action_reference_invalid(self):
         """Test parsing invalid action reference."""
         client = GitHubClient()
@@ -63,7 +63,32 @@ class TestGraphBuilder:
         builder.add_edge("node1", "node2")
         
         assert len(builder.edges) == 1
-    
+
+    def test_add_edges_matches_add_edge(self):
+        """Test that bulk edge insertion dedupes and counts like add_edge."""
+        builder = GraphBuilder()
+        builder.add_edge("a", "b")
+        builder.add_edges("a", ["b", "c", "c"])
+
+        assert [(e["source"], e["target"]) for e in builder.edges] == [("a", "b"), ("a", "c")]
+        assert builder.ref_counts["b"] == 2
+        assert builder.ref_counts["c"] == 2
+
+    def test_refcount_counts_duplicate_edges(self):
+        """Test refcount counts every reference, including duplicate edges."""
+        builder = GraphBuilder()
+        builder.add_node("wf1", "Workflow 1", "workflow")
+        builder.add_node("wf2", "Workflow 2", "workflow")
+        builder.add_edge("wf1", "checkout")
+        builder.add_edge("wf1", "checkout")
+        builder.add_edge("wf2", "checkout")
+        builder.add_node("checkout", "actions/checkout@v4")
+
+        nodes = {node["id"]: node for node in builder.get_graph_data()["nodes"]}
+        assert len(builder.edges) == 2
+        assert nodes["checkout"]["refcount"] == 3
+        assert nodes["wf1"]["refcount"] == 0
+
     def test_add_issues_to_node(self):
         """Test adding issues to a node."""
         builder = GraphBuilder()
@@ -147,6 +172,50 @@ class TestGraphBuilder:
         # Should remove the redundant direct edge
         edge_targets = {e["target"] for e in builder.edges if e["source"] == "node1"}
         assert "node3" not in edge_targets or "node2" in edge_targets
+
+    def test_remove_redundant_edges_rerun_after_new_edge(self):
+        """Test the reduction is skipped when unchanged and redone after add_edge."""
+        builder = GraphBuilder()
+        builder.add_edge("a", "b")
+        builder.add_edge("b", "c")
+        builder.get_graph_data()
+        assert builder._reduced is True
+
+        builder.add_edge("a", "c")
+        assert builder._reduced is False
+        edges = {(e["source"], e["target"]) for e in builder.get_graph_data()["edges"]}
+        assert edges == {("a", "b"), ("b", "c")}
+
+    def test_remove_redundant_edges_deep_transitive(self):
+        """Test that only edges implied by longer paths are removed."""
+        builder = GraphBuilder()
+        builder.add_edge("wf", "a")
+        builder.add_edge("wf", "b")
+        builder.add_edge("a", "c")
+        builder.add_edge("c", "d")
+        builder.add_edge("wf", "d")  # Redundant via wf -> a -> c -> d
+        builder.add_edge("b", "d")   # Kept: no other path from b to d
+        
+        builder._remove_redundant_edges()
+        
+        assert [(e["source"], e["target"]) for e in builder.edges] == [
+            ("wf", "a"), ("wf", "b"), ("a", "c"), ("c", "d"), ("b", "d")
+        ]
+    
+    def test_remove_redundant_edges_with_cycle(self):
+        """Test redundancy removal still works when the graph has a cycle."""
+        builder = GraphBuilder()
+        builder.add_edge("a", "b")
+        builder.add_edge("b", "a")
+        builder.add_edge("a", "c")
+        builder.add_edge("c", "d")
+        builder.add_edge("a", "d")  # Redundant via a -> c -> d
+        
+        builder._remove_redundant_edges()
+        
+        assert [(e["source"], e["target"]) for e in builder.edges] == [
+            ("a", "b"), ("b", "a"), ("a", "c"), ("c", "d")
+        ]
     
     def test_get_graph_data(self):
         """Test getting graph data."""
@@ -178,6 +247,20 @@ class TestGraphBuilder:
         assert node1["issue_count"] == 2
         assert node1["severity"] == "critical"
     
+    def test_add_issues_updates_severity_incrementally(self):
+        """Test issue_count and severity track issues added over several calls."""
+        builder = GraphBuilder()
+        builder.add_node("node1", "Node 1")
+        assert builder.nodes["node1"]["severity"] == "none"
+        
+        builder.add_issues_to_node("node1", [{"severity": "info", "message": "Unknown"}])
+        assert builder.nodes["node1"]["severity"] == "low"
+        
+        builder.add_issues_to_node("node1", [{"severity": "high", "message": "High"}])
+        builder.add_issues_to_node("node1", [{"severity": "medium", "message": "Medium"}])
+        assert builder.nodes["node1"]["issue_count"] == 3
+        assert builder.nodes["node1"]["severity"] == "high"
+    
     def test_get_graph_data_severity_priority(self):
         """Test severity priority in graph data."""
         builder = GraphBuilder()
@@ -1,8 +1,11 @@
 """Tests for main.py"""
+import asyncio
 import pytest
+import main
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, MagicMock
-from main import app, resolve_action_dependencies, audit_repository, _add_package_dependency_nodes
+from fastapi import HTTPException
+from main import app, resolve_action_dependencies, audit_repository, _add_package_dependency_nodes, _resolve_dependencies, _parse_repository
 from github_client import GitHubClient
 from graph_builder import GraphBuilder
 
@@ -21,6 +24,12 @@ class TestHealthEndpoint:
         response = client.get("/api/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+    
+    def test_default_response_uses_orjson(self):
+        """Test the default response class serializes with orjson."""
+        response = main.OrjsonResponse({"nodes": [{"id": "a", "issue_count": 1}], 2: "x"})
+        assert response.body == b'{"nodes":[{"id":"a","issue_count":1}],"2":"x"}'
+        assert response.media_type == "application/json"
 
 
 class TestAuditEndpoint:
@@ -61,6 +70,7 @@ jobs:
             mock_client.get_repository_info = AsyncMock(return_value={"name": "repo"})
             mock_client.parse_action_reference = MagicMock(return_value=("actions", "checkout", "v4", None))
             mock_client.get_action_metadata = AsyncMock(return_value=None)
+            mock_client.aclose = AsyncMock()
             mock_client_class.return_value = mock_client
             
             with patch("main.WorkflowParser") as mock_parser:
@@ -127,6 +137,7 @@ jobs:
                 mock_client.parse_action_reference = MagicMock(return_value=("actions", "checkout", "v4", None))
                 mock_client.get_repository_info = AsyncMock(return_value={"name": "checkout"})
                 mock_client.get_action_metadata = AsyncMock(return_value=None)
+                mock_client.aclose = AsyncMock()
                 mock_client_class.return_value = mock_client
                 
                 with patch("main.GraphBuilder") as mock_graph:
@@ -227,6 +238,33 @@ class TestAnalysesEndpoints:
         assert response.status_code == 404
 
 
+class TestParseRepository:
+    """Test repository string parsing."""
+    
+    @pytest.mark.parametrize("repo_str", [
+        "owner/repo",
+        "https://github.com/owner/repo",
+        "https://www.github.com/owner/repo.git",
+        "https://github.com/owner/repo/tree/main",
+    ])
+    def test_valid_repository_strings(self, repo_str):
+        """Test owner/repo and github.com URLs parse to owner and repo."""
+        assert _parse_repository(repo_str) == ("owner", "repo")
+    
+    @pytest.mark.parametrize("repo_str,detail", [
+        ("owner", "Invalid repository format. Use 'owner/repo'"),
+        ("owner/repo/extra", "Invalid repository format. Use 'owner/repo'"),
+        ("https://gitlab.com/owner/repo", "Only github.com repository URLs are supported"),
+        ("https://github.com/owner", "Invalid repository URL"),
+    ])
+    def test_invalid_repository_strings(self, repo_str, detail):
+        """Test malformed input raises a 400 with a specific message."""
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_repository(repo_str)
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == detail
+
+
 class TestResolveActionDependencies:
     """Test resolve_action_dependencies function."""
     
@@ -260,6 +298,23 @@ class TestResolveActionDependencies:
         # Should not add node because already visited
         assert len(graph.nodes) == 0
     
+    @pytest.mark.asyncio
+    async def test_resolve_action_dependencies_action_budget(self, monkeypatch):
+        """Test resolve_action_dependencies stops once the per-audit action budget is spent."""
+        monkeypatch.setattr(main, "MAX_RESOLVED_ACTIONS", 1)
+        mock_client = MagicMock()
+        mock_client.parse_action_reference = MagicMock(return_value=("owner", "repo", "v1", None))
+        mock_client.get_repository_info = AsyncMock(return_value={"name": "repo"})
+        
+        graph = GraphBuilder()
+        visited = {"other/action@v1"}
+        
+        await resolve_action_dependencies(mock_client, "owner/repo@v1", graph, visited)
+        
+        assert len(graph.nodes) == 0
+        assert visited == {"other/action@v1"}
+        mock_client.get_repository_info.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_resolve_action_dependencies_invalid_reference(self):
         """Test resolve_action_dependencies with invalid reference."""
@@ -297,6 +352,7 @@ class TestResolveActionDependencies:
         mock_client = MagicMock()
         mock_client.parse_action_reference = MagicMock(return_value=("owner", "repo", "v1", None))
         mock_client.get_repository_info = AsyncMock(return_value=None)
+        mock_client.get_action_metadata = AsyncMock(return_value=None)
         
         graph = GraphBuilder()
         visited = set()
@@ -308,6 +364,84 @@ class TestResolveActionDependencies:
         node = graph.nodes.get("owner/repo@v1")
         if node:
             assert len(node["issues"]) > 0
+    
+    @pytest.mark.asyncio
+    async def test_resolve_dependencies_runs_siblings_concurrently(self):
+        """Test sibling dependencies are fetched concurrently and shared ones only once."""
+        in_flight = 0
+        max_in_flight = 0
+        fetched = []
+        
+        async def get_repository_info(owner, repo):
+            nonlocal in_flight, max_in_flight
+            fetched.append(repo)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"name": repo}
+        
+        mock_client = MagicMock()
+        mock_client.parse_action_reference = GitHubClient.parse_action_reference.__get__(mock_client)
+        mock_client.get_repository_info = get_repository_info
+        mock_client.get_action_metadata = AsyncMock(return_value=None)
+        
+        graph = GraphBuilder()
+        graph.add_node("workflow:test.yml", "test.yml", "workflow")
+        refs = ["owner/a@v1", "owner/b@v1", "owner/c@v1", "owner/a@v1"]
+        
+        await _resolve_dependencies(mock_client, "workflow:test.yml", refs, graph, set())
+        
+        assert sorted(fetched) == ["a", "b", "c"]
+        assert max_in_flight == 3
+        assert {e["target"] for e in graph.edges} == {"owner/a@v1", "owner/b@v1", "owner/c@v1"}
+
+    @pytest.mark.asyncio
+    async def test_resolve_dependencies_bounded_by_worker_pool(self):
+        """Test that at most RESOLVE_WORKERS actions are resolved at once."""
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def get_repository_info(owner, repo):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"name": repo}
+        
+        mock_client = MagicMock()
+        mock_client.parse_action_reference = GitHubClient.parse_action_reference.__get__(mock_client)
+        mock_client.get_repository_info = get_repository_info
+        mock_client.get_action_metadata = AsyncMock(return_value=None)
+        
+        graph = GraphBuilder()
+        refs = [f"owner/action{i}@v1" for i in range(20)]
+        
+        await _resolve_dependencies(mock_client, "workflow:test.yml", refs, graph, set())
+        
+        assert max_in_flight == main.RESOLVE_WORKERS
+        assert all(ref in graph.nodes for ref in refs)
+
+
+class TestAuditActionCache:
+    """Test content-keyed caching of action audit results."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_action_is_audited_once(self, monkeypatch):
+        """Test that identical action content reuses the issues and new content is re-audited."""
+        monkeypatch.setattr(main, "_audit_results", main.OrderedDict())
+        auditor = MagicMock()
+        auditor.audit_action = MagicMock(return_value=[{"type": "example", "severity": "low"}])
+        action_yml = {"runs": {"using": "composite"}}
+
+        first = await main._audit_action(auditor, "o/r@v1", action_yml, None, None, "runs: {using: composite}")
+        second = await main._audit_action(auditor, "o/r@v1", action_yml, None, None, "runs: {using: composite}")
+        await main._audit_action(auditor, "o/r@v1", action_yml, None, None, "runs: {using: node20}")
+
+        assert first == second == [{"type": "example", "severity": "low"}]
+        assert second[0] is not first[0]
+        assert auditor.audit_action.call_count == 2
 
 
 class TestPackageDependencyNodes:
@@ -365,7 +499,7 @@ class TestAuditRepository:
         
         with patch("main.cloner") as mock_cloner:
             mock_cloner.clone_repository = MagicMock(return_value=("/tmp/clone", "/tmp/clone"))
-            mock_cloner.get_workflow_files = MagicMock(return_value=[])
+            mock_cloner.read_workflow_files = MagicMock(return_value={})
             mock_cloner.cleanup = MagicMock()
             
             graph = GraphBuilder()
@@ -376,4 +510,33 @@ class TestAuditRepository:
             assert "owner/repo" in graph.nodes
             # Should cleanup
             mock_cloner.cleanup.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_audit_repository_clone_reports_unreadable_workflow(self):
+        """Test that a non-UTF-8 workflow in a clone is reported on the repository node."""
+        mock_client = MagicMock()
+        mock_client.get_repository_info = AsyncMock(return_value={"name": "repo"})
+        decode_error = None
+        try:
+            b"\xff\xfe".decode("utf-8")
+        except UnicodeDecodeError as e:
+            decode_error = e
+        
+        with patch("main.cloner") as mock_cloner:
+            mock_cloner.clone_repository = MagicMock(return_value=("/tmp/clone", "/tmp/clone"))
+            mock_cloner.read_workflow_files = MagicMock(
+                return_value={".github/workflows/binary.yml": decode_error}
+            )
+            mock_cloner.cleanup = MagicMock()
+            
+            graph = GraphBuilder()
+            
+            await audit_repository(mock_client, "owner", "repo", graph, use_clone=True)
+        
+        errors = [
+            issue for issue in graph.nodes["owner/repo"]["issues"]
+            if issue["type"] == "workflow_processing_error"
+        ]
+        assert len(errors) == 1
+        assert errors[0]["evidence"]["workflow"] == "binary.yml"
 
@@ -24,6 +24,19 @@ class TestRepoCloner:
         assert cloner.base_dir.exists()
         assert "actsense-clones" in str(cloner.base_dir)
     
+    @patch('repo_cloner.subprocess.run')
+    def test_clone_repository_unique_directories(self, mock_run):
+        """Test that concurrent clones of one repository get separate directories."""
+        mock_run.return_value = MagicMock(returncode=0, stderr="")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloner = RepoCloner(base_dir=tmpdir)
+            
+            first, _ = cloner.clone_repository("owner", "repo")
+            second, _ = cloner.clone_repository("owner", "repo")
+            
+            assert first != second
+    
     @patch('repo_cloner.subprocess.run')
     def test_clone_repository_basic(self, mock_run):
         """Test cloning a repository without token or branch."""
@@ -46,6 +59,7 @@ class TestRepoCloner:
             assert "clone" in first_call_args
             assert "--depth" in first_call_args
             assert "1" in first_call_args
+            assert "--no-tags" in first_call_args
     
     @patch('repo_cloner.subprocess.run')
     def test_clone_repository_with_token(self, mock_run):
@@ -82,6 +96,20 @@ class TestRepoCloner:
         first_call = mock_run.call_args_list[0]
         assert valid_token in first_call[1]["env"]["GIT_CONFIG_VALUE_0"]
 
+    @patch('repo_cloner.subprocess.run')
+    def test_clone_repository_failure_hides_token(self, mock_run):
+        """Test that a token echoed by git never reaches the error message."""
+        valid_token = "ghp_" + "A" * 36
+        mock_run.return_value = MagicMock(returncode=128, stderr=f"fatal: unexpected header {valid_token}")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloner = RepoCloner(base_dir=tmpdir)
+            with pytest.raises(CloneError) as exc_info:
+                cloner.clone_repository("owner", "repo", token=valid_token)
+        
+        assert valid_token not in exc_info.value.detail
+        assert "***" in exc_info.value.detail
+
     @patch('repo_cloner.subprocess.run')
     def test_clone_repository_with_branch(self, mock_run):
         """Test cloning a repository with specific branch."""
@@ -152,6 +180,26 @@ class TestRepoCloner:
             with pytest.raises(FileNotFoundError):
                 cloner.get_file_content(str(tmpdir), "nonexistent.txt")
     
+    def test_validated_github_token(self):
+        """Test token format validation across the accepted token shapes."""
+        classic = "ghp_" + "a" * 36
+        assert RepoCloner._validated_github_token(classic) == classic
+        fine_grained = "github_pat_" + "b" * 82
+        assert RepoCloner._validated_github_token(fine_grained) == fine_grained
+        long_fine_grained = "github_pat_" + "c" * 120
+        assert RepoCloner._validated_github_token(long_fine_grained) == long_fine_grained
+        for token in ("ghp_short", "a" * 19, "a" * 101, "a" * 30 + "@github.com", "a" * 30 + "\u00e9"):
+            with pytest.raises(ValueError):
+                RepoCloner._validated_github_token(token)
+    
+    def test_get_file_content_normalizes_newlines(self):
+        """Test that file content is decoded as UTF-8 with universal newlines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloner = RepoCloner(base_dir=tmpdir)
+            (Path(tmpdir) / "ci.yml").write_bytes("name: caf\u00e9\r\non: push\rjobs: {}\n".encode("utf-8"))
+            
+            assert cloner.get_file_content(str(tmpdir), "ci.yml") == "name: caf\u00e9\non: push\njobs: {}\n"
+    
     def test_get_workflow_files_empty(self):
         """Test getting workflow files when none exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -178,6 +226,38 @@ class TestRepoCloner:
             assert workflows[0]["name"] == "test.yml"
             assert workflows[0]["path"] == ".github/workflows/test.yml"
     
+    def test_read_workflow_files(self):
+        """Test reading every workflow file into memory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloner = RepoCloner(base_dir=tmpdir)
+            workflows_dir = Path(tmpdir) / ".github" / "workflows"
+            workflows_dir.mkdir(parents=True)
+            (workflows_dir / "ci.yml").write_text("name: ci")
+            (workflows_dir / "release.yaml").write_text("name: release")
+            (workflows_dir / "binary.yml").write_bytes(b"\xff\xfe")
+
+            contents = cloner.read_workflow_files(str(tmpdir))
+            assert isinstance(contents.pop(".github/workflows/binary.yml"), UnicodeDecodeError)
+            assert contents == {
+                ".github/workflows/ci.yml": "name: ci",
+                ".github/workflows/release.yaml": "name: release",
+            }
+
+    def test_get_workflow_files_skips_symlinks(self):
+        """Test that symlinked workflow files are not listed or read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloner = RepoCloner(base_dir=tmpdir)
+            workflows_dir = Path(tmpdir) / ".github" / "workflows"
+            workflows_dir.mkdir(parents=True)
+            (workflows_dir / "ci.yml").write_text("name: ci")
+            outside = Path(tmpdir) / "outside.txt"
+            outside.write_text("not a workflow")
+            (workflows_dir / "linked.yml").symlink_to(outside)
+
+            workflows = cloner.get_workflow_files(str(tmpdir))
+            assert [workflow["name"] for workflow in workflows] == ["ci.yml"]
+            assert cloner.read_workflow_files(str(tmpdir)) == {".github/workflows/ci.yml": "name: ci"}
+
     def test_get_workflow_files_yaml(self):
         """Test getting .yaml workflow files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -226,6 +306,24 @@ class TestRepoCloner:
             cloner.cleanup(str(clone_path))
             assert not clone_path.exists()
     
+    def test_cleanup_removes_renamed_directory(self, monkeypatch):
+        """Test that cleanup deletes the renamed-aside clone in the background."""
+        import concurrent.futures
+        import repo_cloner
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(repo_cloner, "_removal_executor", executor)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloner = RepoCloner(base_dir=tmpdir)
+            clone_path = Path(tmpdir) / "test_clone"
+            (clone_path / ".github" / "workflows").mkdir(parents=True)
+            (clone_path / ".github" / "workflows" / "ci.yml").write_text("name: ci")
+            
+            cloner.cleanup(str(clone_path))
+            assert not clone_path.exists()
+            
+            executor.shutdown(wait=True)
+            assert os.listdir(tmpdir) == []
+    
     def test_cleanup_nonexistent(self):
         """Test cleaning up non-existent path."""
         with tempfile.TemporaryDirectory() as tmpdir:
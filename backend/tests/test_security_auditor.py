@@ -69,6 +69,48 @@ class TestSecurityAuditorIntegration:
         pr_target_issues = [i for i in issues if i.get("type") == "insecure_pull_request_target"]
         assert len(pr_target_issues) > 0
     
+    def test_audit_workflow_runs_secrets_check_off_loop(self, sample_workflow, monkeypatch):
+        """Test that the TruffleHog-backed secrets check runs on a worker thread."""
+        import asyncio
+        import threading
+        threads = []
+
+        def fake_check(workflow, content=None):
+            threads.append(threading.current_thread())
+            return []
+
+        monkeypatch.setattr(SecurityAuditor, "check_secrets_in_workflow", staticmethod(fake_check))
+        asyncio.run(SecurityAuditor.audit_workflow(sample_workflow, content="name: test"))
+        
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+    
+    def test_audit_workflow_cancels_secrets_check_on_error(self, sample_workflow, monkeypatch):
+        """Test that a failing permission check does not leave the secrets task pending."""
+        import asyncio
+        import security_auditor
+        tasks = []
+        ensure_future = asyncio.ensure_future
+
+        def tracking_ensure_future(awaitable):
+            task = ensure_future(awaitable)
+            tasks.append(task)
+            return task
+
+        def failing_check(workflow):
+            raise RuntimeError("broken check")
+
+        async def run():
+            with pytest.raises(RuntimeError):
+                await SecurityAuditor.audit_workflow(sample_workflow, content="name: test")
+            await asyncio.sleep(0)
+            assert len(tasks) == 1
+            assert tasks[0].cancelled()
+
+        monkeypatch.setattr(security_auditor.asyncio, "ensure_future", tracking_ensure_future)
+        monkeypatch.setattr(SecurityAuditor, "check_permissions", staticmethod(failing_check))
+        asyncio.run(run())
+    
     def test_check_pinned_version(self):
         """Test check_pinned_version delegation."""
         # Unpinned version
@@ -948,3 +948,24 @@ class TestNewRuleEdgeCases:
         for wf in malformed:
             for fn in fns:
                 assert isinstance(fn(wf), list)
+
+
+class TestUnpinnableJavascriptScanCache:
+    """Tests for the content-keyed cache of JS bundle scans."""
+
+    def test_identical_bundles_are_scanned_once(self, monkeypatch):
+        """Test that a second action shipping the same bundle reuses the scan."""
+        action_yml = {"runs": {"using": "node20", "main": "dist/index.js"}}
+        bundle = "const r = await fetch('https://example.com/tool.tar.gz');"
+        security_rules._js_scan_results.clear()
+        first = security_rules.check_unpinnable_javascript_action(action_yml, "a/b@v1", bundle)
+
+        class FailingPattern:
+            def search(self, _content):
+                raise AssertionError("bundle should have been served from the cache")
+
+        monkeypatch.setattr(security_rules, "_JS_DOWNLOAD_RE", FailingPattern())
+        second = security_rules.check_unpinnable_javascript_action(action_yml, "a/b@v2", bundle)
+
+        assert [i["type"] for i in first] == ["unpinned_javascript_resources"]
+        assert second[0]["action"] == "a/b@v2"
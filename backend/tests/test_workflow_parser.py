@@ -1,6 +1,7 @@
 """Tests for workflow_parser.py"""
 import pytest
 import yaml
+import workflow_parser
 from workflow_parser import WorkflowParser
 
 
@@ -29,6 +30,12 @@ jobs:
         result = WorkflowParser.parse_workflow(content)
         assert "error" in result
     
+    def test_load_yaml_raises_on_invalid_yaml(self):
+        """Test that load_yaml leaves syntax errors to the caller."""
+        with pytest.raises(yaml.YAMLError):
+            WorkflowParser.load_yaml("invalid: yaml: content: [")
+        assert WorkflowParser.load_yaml("on: push") == {"on": "push"}
+
     def test_parse_workflow_empty(self):
         """Test parsing empty content."""
         result = WorkflowParser.parse_workflow("")
@@ -218,6 +225,20 @@ runs:
         result = WorkflowParser.parse_action_yml(content)
         assert "error" in result
     
+    def test_parse_action_yml_cached_returns_copies(self, monkeypatch):
+        """Test that repeated content is parsed once and each caller gets its own copy."""
+        content = "name: 'Cached Action'\nruns:\n  using: 'node20'\n  main: 'index.js'\n"
+        first = WorkflowParser.parse_action_yml(content)
+        
+        def fail(_content):
+            raise AssertionError("content should have been served from the cache")
+        
+        monkeypatch.setattr(workflow_parser, "_safe_load_workflow_yaml", fail)
+        first["runs"]["using"] = "mutated"
+        second = WorkflowParser.parse_action_yml(content)
+        
+        assert second["runs"]["using"] == "node20"
+    
     def test_parse_action_yml_empty(self):
         """Test parsing empty action.yml."""
         result = WorkflowParser.parse_action_yml("")
@@ -358,3 +379,11 @@ class TestOnKeyParsing:
         w = result["jobs"]["j"]["steps"][0]["with"]
         assert w["mode"] == "on"
         assert w["other"] == "off"
+
+    def test_global_safe_loader_is_untouched(self):
+        WorkflowParser.parse_workflow("name: t\non: [push]\njobs: {}")
+        assert yaml.safe_load("on: yes") == {True: True}
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available")
+    def test_uses_libyaml_loader(self):
+        assert issubclass(workflow_parser._WorkflowYamlLoader, yaml.CSafeLoader)
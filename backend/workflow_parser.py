@@ -1,4 +1,6 @@
 """Parse GitHub Actions workflows and action.yml files."""
+import copy
+import functools
 import re
 import yaml
 from typing import List, Dict, Any, Optional, Tuple
@@ -6,8 +8,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# libyaml's CSafeLoader is roughly 10x faster than the pure-Python SafeLoader.
+# It shares the same Python resolver, so the bool override below applies to
+# either base class.
+_YAML_BASE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _YAML_BASE_LOADER is yaml.SafeLoader:
+    logger.warning("libyaml is not available; falling back to the pure-Python YAML loader")
 
-class _WorkflowYamlLoader(yaml.SafeLoader):
+
+class _WorkflowYamlLoader(_YAML_BASE_LOADER):
     """SafeLoader configuration for GitHub Actions YAML boolean handling.
 
     GitHub Actions uses ``on:`` as the trigger key. Under YAML 1.1 (which PyYAML
@@ -23,11 +32,11 @@ class _WorkflowYamlLoader(yaml.SafeLoader):
 
 # Rebuild the implicit-resolver table without the YAML 1.1 bool entries, then
 # re-register a bool resolver limited to true/false. Building a fresh dict with
-# fresh lists avoids mutating yaml.SafeLoader's shared class state.
+# fresh lists avoids mutating the shared resolver class state.
 _WORKFLOW_SAFE_RESOLVERS = {
     ch: [(tag, regexp) for tag, regexp in mappings
          if tag != "tag:yaml.org,2002:bool"]
-    for ch, mappings in yaml.SafeLoader.yaml_implicit_resolvers.items()
+    for ch, mappings in _YAML_BASE_LOADER.yaml_implicit_resolvers.items()
 }
 _BOOL_TRUE_FALSE = re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$")
 for _ch in "tTfF":
@@ -38,16 +47,50 @@ _WorkflowYamlLoader.yaml_implicit_resolvers = _WORKFLOW_SAFE_RESOLVERS
 
 
 def _safe_load_workflow_yaml(content: str) -> Any:
-    """Use yaml.safe_load with GitHub Actions compatible bool resolution."""
-    original_resolvers = yaml.SafeLoader.yaml_implicit_resolvers
-    yaml.SafeLoader.yaml_implicit_resolvers = _WORKFLOW_SAFE_RESOLVERS
+    """Safely load YAML with GitHub Actions compatible bool resolution."""
+    return yaml.load(content, Loader=_WorkflowYamlLoader)
+
+
+# Optional second-level store behind the in-process LRU (e.g. a
+# ParsedActionCache), so parses survive restarts; set with
+# WorkflowParser.set_action_store.
+_action_store = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_action_yml_cached(content: str) -> Dict[str, Any]:
+    """Parse action.yml content once per distinct content string."""
+    if _action_store is not None:
+        parsed = _action_store.get(content)
+        if parsed is not None:
+            return parsed
     try:
-        return yaml.safe_load(content)
-    finally:
-        yaml.SafeLoader.yaml_implicit_resolvers = original_resolvers
+        parsed = _safe_load_workflow_yaml(content) or {}
+    except yaml.YAMLError:
+        logger.exception("Failed to parse action YAML")
+        return {"error": "Invalid YAML content"}
+    if _action_store is not None and isinstance(parsed, dict):
+        _action_store.set(content, parsed)
+    return parsed
 
 
 class WorkflowParser:
+    @staticmethod
+    def set_action_store(store) -> None:
+        """Use store (with get/set by content) behind the action.yml parse cache."""
+        global _action_store
+        _action_store = store
+        _parse_action_yml_cached.cache_clear()
+
+    @staticmethod
+    def load_yaml(content: str) -> Any:
+        """Load workflow YAML as-is, raising yaml.YAMLError on invalid syntax.
+
+        For callers that report syntax errors themselves; parse_workflow
+        handles them and always returns a dict.
+        """
+        return _safe_load_workflow_yaml(content)
+
     @staticmethod
     def parse_workflow(content: str) -> Dict[str, Any]:
         """Parse a workflow YAML file."""
@@ -145,11 +188,9 @@ class WorkflowParser:
     @staticmethod
     def parse_action_yml(content: str) -> Dict[str, Any]:
         """Parse an action.yml or action.yaml file."""
-        try:
-            return _safe_load_workflow_yaml(content) or {}
-        except yaml.YAMLError:
-            logger.exception("Failed to parse action YAML")
-            return {"error": "Invalid YAML content"}
+        # Popular actions recur across workflows with identical content; the
+        # copy keeps callers from mutating the shared cached result.
+        return copy.deepcopy(_parse_action_yml_cached(content))
 
     @staticmethod
     def extract_action_dependencies(action_yml: Dict[str, Any]) -> List[str]:
@@ -67,4 +67,4 @@ show_access_info() {
 show_access_info &
 
 # Start the server with reduced log level to minimize output
-exec uv run uvicorn main:app --host 0.0.0.0 --port "$PORT" --log-level warning
+exec uv run uvicorn main:app --host 0.0.0.0 --port "$PORT" --loop uvloop --http httptools --log-level warning